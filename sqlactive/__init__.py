@@ -221,7 +221,7 @@ of the ``execute`` method::
 
 from .active_record import ActiveRecordMixin
 from .base_model import ActiveRecordBaseModel
-from .conn import DBConnection, execute
+from .conn import DBConnection, execute, execute_many
 from .definitions import JOINED, SELECT_IN, SUBQUERY
 from .serialization import SerializationMixin
 from .timestamp import TimestampMixin
@@ -236,6 +236,7 @@ __all__ = [
     'SerializationMixin',
     'TimestampMixin',
     'execute',
+    'execute_many',
 ]
 
 
@@ -8,13 +8,14 @@ It implements the functionality of both ``SessionMixin`` and
 ``SmartQueryMixin`` mixins.
 """
 
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from typing import Any, Literal, overload
 
 from deprecated import deprecated
 from sqlalchemy.engine import Result, Row, ScalarResult
 from sqlalchemy.exc import NoResultFound, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
+from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 from sqlalchemy.sql import Select, select
 from sqlalchemy.sql._typing import _ColumnsClauseArgument
@@ -34,6 +35,11 @@ from .types import (
 )
 from .utils import classproperty
 
+_NON_EAGER_LOADS = frozenset(
+    ('dynamic', 'write_only', 'noload', 'raise', 'raise_on_sql'),
+)
+"""Relationship loader strategies that eager loaders cannot override."""
+
 
 class ActiveRecordMixin(SessionMixin, SmartQueryMixin):
     """Mixin for Active Record style models.
@@ -178,7 +184,7 @@ class ActiveRecordMixin(SessionMixin, SmartQueryMixin):
         for name, value in kwargs.items():
             if not hasattr(self, name):
                 raise ModelAttributeError(name, self.__class__.__name__)
-            if name not in self.settable_attributes:
+            if name not in self.settable_attributes_set:
                 raise NoSettableError(name, self.__class__.__name__)
             setattr(self, name, value)
 
@@ -580,9 +586,20 @@ class ActiveRecordMixin(SessionMixin, SmartQueryMixin):
         """
         async with cls.AsyncSession() as session:
             try:
+                # load the collections the unit of work has to update
+                # in one query each instead of one query per row
                 query = cls.smart_query(
                     filters={f'{cls.primary_key_name}__in': ids},
-                ).query
+                ).query.options(
+                    *(
+                        selectinload(relationship.class_attribute)
+                        for relationship in cls.__mapper__.relationships
+                        if relationship.uselist
+                        and not relationship.viewonly
+                        and not relationship.passive_deletes
+                        and relationship.lazy not in _NON_EAGER_LOADS
+                    ),
+                )
                 rows = (await session.execute(query)).scalars().all()
                 for row in rows:
                     await session.delete(row)
@@ -1097,6 +1114,52 @@ class ActiveRecordMixin(SessionMixin, SmartQueryMixin):
         async_query = cls.get_async_query()
         return await async_query.all(scalars)
 
+    @classmethod
+    def stream(cls, batch_size: int = 1000) -> AsyncIterator[Self]:
+        """Fetch the rows in batches and yield them one by one.
+
+        Unlike ``all()``, the rows are not loaded into memory at once.
+        They are fetched in batches of ``batch_size`` rows using
+        a server side cursor (``yield_per``) while iterating.
+
+        .. warning::
+            The session is kept open until the iteration is finished.
+            Also, joined eager loading of collections is not supported
+            in this mode; use ``prefetch()`` or ``with_subquery()``
+            instead.
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            Number of rows fetched per batch, by default 1000.
+
+        Returns
+        -------
+        AsyncIterator[Self]
+            Async iterator of instances.
+
+        Examples
+        --------
+        Assume a model ``User``:
+        >>> from sqlactive import ActiveRecordBaseModel
+        >>> class User(ActiveRecordBaseModel):
+        ...     __tablename__ = 'users'
+        ...     id: Mapped[int] = mapped_column(primary_key=True)
+        ...     username: Mapped[str] = mapped_column()
+        ...     name: Mapped[str] = mapped_column()
+        ...     age: Mapped[int] = mapped_column()
+
+        Usage:
+        >>> async for user in User.stream(batch_size=100):
+        ...     print(user)
+        User(id=1)
+        User(id=2)
+        ...
+
+        """
+        async_query = cls.get_async_query()
+        return async_query.stream(batch_size)
+
     @classmethod
     async def count(cls) -> int:
         """Fetch the number of rows.
@@ -1711,6 +1774,8 @@ class ActiveRecordMixin(SessionMixin, SmartQueryMixin):
 
         It is recommended to select specific columns. You can use
         the ``select_columns`` parameter to select specific columns.
+        They replace the columns clause of the query, but the existing
+        FROMs are maintained (as in ``select()``).
 
         Parameters
         ----------
@@ -1881,6 +1946,55 @@ class ActiveRecordMixin(SessionMixin, SmartQueryMixin):
         """Synonym for ``limit()``."""
         return cls.limit(top)
 
+    @classmethod
+    def paginate(cls, offset: int = 0, limit: int | None = None) -> AsyncQuery[Self]:
+        """Apply both OFFSET and LIMIT criteria to the query.
+
+        Both values are validated at once. A zero ``offset`` and
+        a ``None`` limit are no-ops, so the query is left untouched.
+
+        Parameters
+        ----------
+        offset : int, optional
+            Number of rows to skip, by default 0.
+        limit : int | None, optional
+            Maximum number of rows to return, by default None
+            (no limit).
+
+        Returns
+        -------
+        AsyncQuery[Self]
+            Async query instance for chaining.
+
+        Raises
+        ------
+        NegativeIntegerError
+            If ``offset`` or ``limit`` is negative.
+
+        Examples
+        --------
+        Assume a model ``User``:
+        >>> from sqlactive import ActiveRecordBaseModel
+        >>> class User(ActiveRecordBaseModel):
+        ...     __tablename__ = 'users'
+        ...     id: Mapped[int] = mapped_column(primary_key=True)
+        ...     username: Mapped[str] = mapped_column()
+        ...     name: Mapped[str] = mapped_column()
+        ...     age: Mapped[int] = mapped_column()
+
+        Usage:
+        >>> users = await User.paginate(offset=10, limit=2).all()
+        >>> users
+        [User(id=11), User(id=12)]
+        >>> User.paginate(offset=-1)
+        Traceback (most recent call last):
+            ...
+        NegativeIntegerError: offset must be >= 0, got -1
+
+        """
+        async_query = cls.get_async_query()
+        return async_query.paginate(offset, limit)
+
     @classmethod
     def join(cls, *paths: EagerLoadPath) -> AsyncQuery[Self]:
         """Apply joined eager loading using LEFT OUTER JOIN.
@@ -2069,6 +2183,69 @@ class ActiveRecordMixin(SessionMixin, SmartQueryMixin):
         async_query = cls.get_async_query()
         return async_query.with_subquery(*paths, model=cls)
 
+    @classmethod
+    def prefetch(cls, *paths: InstrumentedAttribute[Any]) -> AsyncQuery[Self]:
+        """Selectinload eager loading.
+
+        Emits a second SELECT statement with an IN clause on the
+        primary keys of the parent objects for each relationship
+        to be loaded, so the relationships of all result objects
+        are loaded at once (1 + 1 queries instead of 1 + N).
+
+        This is a shortcut for ``with_subquery((path, True), ...)``.
+        Unlike ``subqueryload()``, ``selectinload()`` does not
+        depend on the ordering of the parent query, so it is safe
+        to use it in conjunction with a limiting modifier such as
+        ``limit()`` or ``offset()`` without ``order_by()``.
+
+        .. note::
+            Only direct relationships can be loaded.
+
+        Parameters
+        ----------
+        *paths : InstrumentedAttribute[Any]
+            Relationship attributes to load.
+
+        Returns
+        -------
+        AsyncQuery[Self]
+            Async query instance for chaining.
+
+        Raises
+        ------
+        RelationError
+            If relationship does not exist in the model.
+
+        Examples
+        --------
+        Assume a model ``User``:
+        >>> from sqlactive import ActiveRecordBaseModel
+        >>> class User(ActiveRecordBaseModel):
+        ...     __tablename__ = 'users'
+        ...     id: Mapped[int] = mapped_column(primary_key=True)
+        ...     username: Mapped[str] = mapped_column()
+        ...     name: Mapped[str] = mapped_column()
+        ...     age: Mapped[int] = mapped_column()
+        ...     posts: Mapped[list['Post']] = relationship(
+        ...         back_populates='user'
+        ...     )
+        ...     comments: Mapped[list['Comment']] = relationship(
+        ...         back_populates='user'
+        ...     )
+
+        Usage:
+        >>> users = await User.prefetch(User.posts, User.comments).all()
+        >>> users[0]
+        User(id=1)
+        >>> users[0].posts     # loaded using SELECT IN
+        [Post(id=1), Post(id=2), ...]
+        >>> users[0].comments  # loaded using SELECT IN
+        [Comment(id=1), Comment(id=2), ...]
+
+        """
+        async_query = cls.get_async_query()
+        return async_query.prefetch(*paths, model=cls)
+
     @classmethod
     def with_schema(cls, schema: EagerSchema) -> AsyncQuery[Self]:
         """Apply joined, subqueryload and selectinload eager loading.
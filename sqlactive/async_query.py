@@ -7,12 +7,14 @@ It implements the functionality of both ``SessionMixin`` and
 ``SmartQueryMixin`` mixins.
 """
 
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Callable, Sequence
+from functools import partial
 from typing import Any, Generic, Literal, overload
 
 from sqlalchemy.engine import Result, Row, ScalarResult
 from sqlalchemy.orm import joinedload, selectinload, subqueryload
 from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.orm.strategy_options import _AbstractLoad
 from sqlalchemy.sql._typing import _ColumnsClauseArgument
 from sqlalchemy.sql.base import ExecutableOption
 from sqlalchemy.sql.elements import ColumnElement
@@ -30,6 +32,27 @@ from .types import (
     T,
 )
 
+_EAGER_LOADERS: dict[
+    bool,
+    tuple[
+        Callable[[InstrumentedAttribute[Any]], _AbstractLoad],
+        Callable[[InstrumentedAttribute[Any]], _AbstractLoad],
+    ],
+] = {
+    True: (joinedload, partial(joinedload, innerjoin=True)),
+    False: (subqueryload, selectinload),
+}
+"""Eager loaders for the ``joined`` flag of eager loading paths.
+
+The first loader is used for simple paths (i.e. ``User.posts``)
+and the second one for paths flagged with ``True``
+(i.e. ``(User.posts, True)``).
+"""
+
+
+_COUNT_EXPR = func.count()
+"""Count aggregate function shared by all count queries."""
+
 
 class AsyncQuery(SessionMixin, SmartQueryMixin, Generic[T]):
     """Async wrapper for ``sqlalchemy.sql.Select``.
@@ -95,9 +118,12 @@ class AsyncQuery(SessionMixin, SmartQueryMixin, Generic[T]):
 
     __abstract__ = True
 
-    query: Query
+    _query: Query
     """The wrapped ``sqlalchemy.sql.Select`` instance."""
 
+    _query_str: str | None = None
+    """Cached raw SQL of the wrapped query."""
+
     def __init__(self, query: Query) -> None:
         """Build an async wrapper for SQLAlchemy ``Query``.
 
@@ -113,6 +139,16 @@ class AsyncQuery(SessionMixin, SmartQueryMixin, Generic[T]):
         """
         self.query = query
 
+    @property
+    def query(self) -> Query:
+        """The wrapped ``sqlalchemy.sql.Select`` instance."""
+        return self._query
+
+    @query.setter
+    def query(self, query: Query) -> None:
+        self._query = query
+        self._query_str = None
+
     async def execute(self) -> Result[Any]:
         """Execute the query.
 
@@ -125,6 +161,45 @@ class AsyncQuery(SessionMixin, SmartQueryMixin, Generic[T]):
         async with self.AsyncSession() as session:
             return await session.execute(self.query)
 
+    @classmethod
+    async def gather(cls, *queries: 'AsyncQuery[Any]') -> list[Result[Any]]:
+        """Execute several queries using a single session.
+
+        The queries are executed one after another within the same
+        session, so the connection is acquired only once instead of
+        once per query.
+
+        .. note::
+            A session cannot run statements concurrently, so the
+            queries are not executed in parallel.
+
+        Parameters
+        ----------
+        *queries : AsyncQuery[Any]
+            Queries to execute.
+
+        Returns
+        -------
+        list[Result[Any]]
+            Results of the queries, in the same order.
+
+        Examples
+        --------
+        Assume two models ``User`` and ``Post``:
+        >>> users_query = User.where(age__gt=30)
+        >>> posts_query = Post.where(rating=5)
+        >>> users_result, posts_result = await AsyncQuery.gather(
+        ...     users_query, posts_query
+        ... )
+        >>> users_result.scalars().all()
+        [User(id=1), User(id=2), ...]
+        >>> posts_result.scalars().all()
+        [Post(id=1), Post(id=4), ...]
+
+        """
+        async with cls.AsyncSession() as session:
+            return [await session.execute(query.query) for query in queries]
+
     async def scalars(self) -> ScalarResult[T]:
         """Execute the query and return the result as scalars.
 
@@ -478,6 +553,57 @@ class AsyncQuery(SessionMixin, SmartQueryMixin, Generic[T]):
 
         return (await self.execute()).all()
 
+    async def stream(self, batch_size: int = 1000) -> AsyncIterator[T]:
+        """Fetch the rows in batches and yield them one by one.
+
+        Unlike ``all()``, the rows are not loaded into memory at once.
+        They are fetched in batches of ``batch_size`` rows using
+        a server side cursor (``yield_per``) while iterating.
+
+        .. warning::
+            The session is kept open until the iteration is finished.
+            Also, joined eager loading of collections is not supported
+            in this mode; use ``prefetch()`` or ``with_subquery()``
+            instead.
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            Number of rows fetched per batch, by default 1000.
+
+        Yields
+        ------
+        T
+            Instances (scalars).
+
+        Examples
+        --------
+        Assume a model ``User``:
+        >>> from sqlactive import ActiveRecordBaseModel
+        >>> class User(ActiveRecordBaseModel):
+        ...     __tablename__ = 'users'
+        ...     id: Mapped[int] = mapped_column(primary_key=True)
+        ...     username: Mapped[str] = mapped_column()
+        ...     name: Mapped[str] = mapped_column()
+        ...     age: Mapped[int] = mapped_column()
+
+        Usage:
+        >>> query = select(User)
+        >>> async_query = AsyncQuery(query)
+        >>> async for user in async_query.stream(batch_size=100):
+        ...     print(user)
+        User(id=1)
+        User(id=2)
+        ...
+
+        """
+        async with self.AsyncSession() as session:
+            result = await session.stream_scalars(
+                self.query.execution_options(yield_per=batch_size),
+            )
+            async for row in result:
+                yield row
+
     async def count(self) -> int:
         """Fetch the number of rows.
 
@@ -697,6 +823,39 @@ class AsyncQuery(SessionMixin, SmartQueryMixin, Generic[T]):
         self._set_count_query()
         return (await self.execute()).scalars().unique().one()
 
+    def clone(self) -> Self:
+        """Return a new instance wrapping the same query.
+
+        The wrapped ``sqlalchemy.sql.Select`` is immutable, so the
+        clone shares it and further method calls on either instance
+        do not affect the other one.
+
+        Returns
+        -------
+        Self
+            A new instance wrapping the current query.
+
+        Examples
+        --------
+        Assume a model ``User``:
+        >>> from sqlactive import ActiveRecordBaseModel
+        >>> class User(ActiveRecordBaseModel):
+        ...     __tablename__ = 'users'
+        ...     id: Mapped[int] = mapped_column(primary_key=True)
+        ...     username: Mapped[str] = mapped_column()
+        ...     name: Mapped[str] = mapped_column()
+        ...     age: Mapped[int] = mapped_column()
+
+        Usage:
+        >>> async_query = User.get_async_query().filter(age__gt=25)
+        >>> first_page = async_query.clone().limit(10)
+        >>> second_page = async_query.clone().offset(10).limit(10)
+        >>> async_query
+        'SELECT users.id, users.username, ... FROM users WHERE users.age > :age_1'
+
+        """
+        return type(self)(self.query)
+
     def select(self, *entities: _ColumnsClauseArgument[Any]) -> Self:
         """Replace the columns clause with the given entities.
 
@@ -852,6 +1011,9 @@ class AsyncQuery(SessionMixin, SmartQueryMixin, Generic[T]):
         InvalidRequestError: The unique() method must be invoked on this Result...
 
         """
+        if not args:
+            return self
+
         self.query = self.query.options(*args)
         return self
 
@@ -1080,6 +1242,8 @@ class AsyncQuery(SessionMixin, SmartQueryMixin, Generic[T]):
 
         It is recommended to select specific columns. You can use
         the ``select_columns`` parameter to select specific columns.
+        They replace the columns clause of the query, but the existing
+        FROMs are maintained (as in ``select()``).
 
         Parameters
         ----------
@@ -1145,7 +1309,10 @@ class AsyncQuery(SessionMixin, SmartQueryMixin, Generic[T]):
 
         """
         if select_columns:
-            self.select(*select_columns)
+            self.query = self.query.with_only_columns(
+                *select_columns,
+                maintain_column_froms=True,
+            )
 
         group_columns, group_attrs = self._split_columns_and_attrs(columns)
         self.query = self.smart_query(
@@ -1267,6 +1434,69 @@ class AsyncQuery(SessionMixin, SmartQueryMixin, Generic[T]):
         """Synonym for ``limit()``."""
         return self.limit(top)
 
+    def paginate(self, offset: int = 0, limit: int | None = None) -> Self:
+        """Apply both OFFSET and LIMIT criteria to the query.
+
+        Both values are validated at once. A zero ``offset`` and
+        a ``None`` limit are no-ops, so the query is left untouched.
+
+        Parameters
+        ----------
+        offset : int, optional
+            Number of rows to skip, by default 0.
+        limit : int | None, optional
+            Maximum number of rows to return, by default None
+            (no limit).
+
+        Returns
+        -------
+        Self
+            The instance itself for method chaining.
+
+        Raises
+        ------
+        NegativeIntegerError
+            If ``offset`` or ``limit`` is negative.
+
+        Examples
+        --------
+        Assume a model ``User``:
+        >>> from sqlactive import ActiveRecordBaseModel
+        >>> class User(ActiveRecordBaseModel):
+        ...     __tablename__ = 'users'
+        ...     id: Mapped[int] = mapped_column(primary_key=True)
+        ...     username: Mapped[str] = mapped_column()
+        ...     name: Mapped[str] = mapped_column()
+        ...     age: Mapped[int] = mapped_column()
+
+        Usage:
+        >>> query = select(User)
+        >>> async_query = AsyncQuery(query)
+        >>> users = await async_query.paginate(offset=10, limit=2).all()
+        >>> users
+        [User(id=11), User(id=12)]
+        >>> async_query.paginate(offset=-1)
+        Traceback (most recent call last):
+            ...
+        NegativeIntegerError: offset must be >= 0, got -1
+
+        """
+        if offset < 0:
+            raise NegativeIntegerError(name='offset', value=offset)
+
+        if limit is not None and limit < 0:
+            raise NegativeIntegerError(name='limit', value=limit)
+
+        query = self.query
+        if offset:
+            query = query.offset(offset)
+
+        if limit is not None:
+            query = query.limit(limit)
+
+        self.query = query
+        return self
+
     def join(self, *paths: EagerLoadPath, model: type[T] | None = None) -> Self:
         """Apply joined eager loading using LEFT OUTER JOIN.
 
@@ -1465,6 +1695,81 @@ class AsyncQuery(SessionMixin, SmartQueryMixin, Generic[T]):
         """
         return self._apply_eager_loading_options(*paths, model=model)
 
+    def prefetch(
+        self,
+        *paths: InstrumentedAttribute[Any],
+        model: type[T] | None = None,
+    ) -> Self:
+        """Selectinload eager loading.
+
+        Emits a second SELECT statement with an IN clause on the
+        primary keys of the parent objects for each relationship
+        to be loaded, so the relationships of all result objects
+        are loaded at once (1 + 1 queries instead of 1 + N).
+
+        This is a shortcut for ``with_subquery((path, True), ...)``.
+        Unlike ``subqueryload()``, ``selectinload()`` does not
+        depend on the ordering of the parent query, so it is safe
+        to use it in conjunction with a limiting modifier such as
+        ``limit()`` or ``offset()`` without ``order_by()``.
+
+        .. note::
+            Only direct relationships can be loaded.
+
+        Parameters
+        ----------
+        *paths : InstrumentedAttribute[Any]
+            Relationship attributes to load.
+        model : type[T] | None, optional
+            If given, checks that each path belongs to this model,
+            by default None.
+
+        Returns
+        -------
+        Self
+            The instance itself for method chaining.
+
+        Raises
+        ------
+        RelationError
+            If relationship does not exist in the given model.
+
+        Examples
+        --------
+        Assume a model ``User``:
+        >>> from sqlactive import ActiveRecordBaseModel
+        >>> class User(ActiveRecordBaseModel):
+        ...     __tablename__ = 'users'
+        ...     id: Mapped[int] = mapped_column(primary_key=True)
+        ...     username: Mapped[str] = mapped_column()
+        ...     name: Mapped[str] = mapped_column()
+        ...     age: Mapped[int] = mapped_column()
+        ...     posts: Mapped[list['Post']] = relationship(
+        ...         back_populates='user'
+        ...     )
+        ...     comments: Mapped[list['Comment']] = relationship(
+        ...         back_populates='user'
+        ...     )
+
+        Usage:
+        >>> query = select(User)
+        >>> async_query = AsyncQuery(query)
+        >>> users = await async_query.prefetch(
+        ...     User.posts, User.comments
+        ... ).all()
+        >>> users[0]
+        User(id=1)
+        >>> users[0].posts     # loaded using SELECT IN
+        [Post(id=1), Post(id=2), ...]
+        >>> users[0].comments  # loaded using SELECT IN
+        [Comment(id=1), Comment(id=2), ...]
+
+        """
+        return self._apply_eager_loading_options(
+            *((path, True) for path in paths),
+            model=model,
+        )
+
     def with_schema(self, schema: EagerSchema) -> Self:
         """Apply joined, subqueryload and selectinload eager loading.
 
@@ -1552,11 +1857,20 @@ class AsyncQuery(SessionMixin, SmartQueryMixin, Generic[T]):
         User(id=1)
 
         """
-        return self.options(*self.eager_expr(schema or {}))
+        if not schema:
+            return self
+
+        return self.options(*self.eager_expr(schema))
 
     def __str__(self) -> str:
-        """Return the raw SQL query."""
-        return str(self.query)
+        """Return the raw SQL query.
+
+        The compiled string is cached until the query changes.
+        """
+        if self._query_str is None:
+            self._query_str = str(self._query)
+
+        return self._query_str
 
     def __repr__(self) -> str:
         """Return the raw SQL query."""
@@ -1565,7 +1879,7 @@ class AsyncQuery(SessionMixin, SmartQueryMixin, Generic[T]):
     def _split_columns_and_attrs(
         self,
         columns_and_attrs: Sequence[ColumnExpressionOrStrLabelArgument],
-    ) -> tuple[list[str], list[str]]:
+    ) -> tuple[list[ColumnExpressionOrStrLabelArgument], list[str]]:
         """Split columns and attrs.
 
         Parameters
@@ -1575,17 +1889,19 @@ class AsyncQuery(SessionMixin, SmartQueryMixin, Generic[T]):
 
         Returns
         -------
-        tuple[list[str], list[str]]
+        tuple[list[ColumnExpressionOrStrLabelArgument], list[str]]
             A tuple of columns and attrs.
 
         """
-        columns = []
-        attrs = []
+        columns: list[ColumnExpressionOrStrLabelArgument]
+        attrs: list[str]
+        columns, attrs = [], []
+        add_column, add_attr = columns.append, attrs.append
         for column in columns_and_attrs:
             if isinstance(column, str):
-                attrs.append(column)
+                add_attr(column)
             else:
-                columns.append(column)
+                add_column(column)
 
         return columns, attrs
 
@@ -1630,38 +1946,36 @@ class AsyncQuery(SessionMixin, SmartQueryMixin, Generic[T]):
         EagerLoadPathTupleError
             If the second element of tuple is not boolean.
         RelationError
-            If relationship does not exist.
+            If relationship does not exist in the given model.
 
         """
-        options = []
-        for path in paths:
-            # if path is like (User.comments, True)
-            if isinstance(path, tuple):
-                attr, use_selectin = path
-                if not isinstance(use_selectin, bool):
-                    raise EagerLoadPathTupleError(path)
+        if not paths:
+            return self
 
-            # simple paths like User.posts, User.comments
-            else:
-                attr, use_selectin = path, False  # subqueryload by default
+        # relationships of the model, if given, to validate each path
+        relationships = frozenset(model.__mapper__.relationships) if model else None
+
+        loaders = _EAGER_LOADERS[joined]
+        options: list[ExecutableOption] = []
+        for path in paths:
+            # normalize simple paths like User.posts to (User.posts, False)
+            # and validate the flag of paths like (User.comments, True)
+            attr, use_selectin = path if isinstance(path, tuple) else (path, False)
+            if not isinstance(use_selectin, bool):
+                raise EagerLoadPathTupleError(path)  # type: ignore
 
             # raise error if, i.e., model is User
-            # and path is Post.comments
-            if model and attr.class_ != model:
-                raise RelationError(attr.key, model.__name__)
+            # and path is Post.comments or User.name
+            if relationships is not None and attr.property not in relationships:
+                raise RelationError(attr.key, model.__name__)  # type: ignore
 
-            if joined:
-                options.append(joinedload(attr, innerjoin=use_selectin))
-            else:
-                options.append(
-                    selectinload(attr) if use_selectin else subqueryload(attr),
-                )
+            options.append(loaders[use_selectin](attr))
 
         return self.options(*options)
 
     def _set_count_query(self) -> None:
         """Set the count aggregate function to the query."""
         self.query = self.query.with_only_columns(
-            func.count(),
+            _COUNT_EXPR,
             maintain_column_froms=True,
         ).order_by(None)
@@ -84,6 +84,8 @@ class DBConnection:
         **kw : Any
             Keyword arguments to be passed to the
             ``sqlalchemy.ext.asyncio.create_async_engine`` function.
+            For example, ``query_cache_size`` sets the size of the
+            compiled statement cache of the engine.
 
         """
         self.async_engine = create_async_engine(url, **kw)
@@ -114,7 +116,7 @@ class DBConnection:
 
 
 async def execute(
-    async_scoped_session: async_scoped_session[AsyncSession],
+    async_scoped_session: async_scoped_session[AsyncSession] | AsyncSession,
     statement: TypedReturnsRows[RowType],
     params: _CoreAnyExecuteParams | None = None,
     **kwargs,
@@ -126,6 +128,11 @@ async def execute(
     of the ``execute`` method of the
     ``sqlalchemy.ext.asyncio.AsyncSession`` class.
 
+    If an already open ``AsyncSession`` is given instead of the
+    scoped session, the statement is executed on it and the
+    session is left open, so it can be reused for several
+    statements (e.g. one session per request).
+
     Examples
     --------
     >>> from sqlactive import DBConnection
@@ -138,6 +145,47 @@ async def execute(
     >>> users
     [(20, 1), (22, 4), (25, 12)]
 
+    Reusing an open session:
+    >>> async with conn.async_scoped_session() as session:
+    ...     result = await execute(session, query)
+    ...     other_result = await execute(session, other_query)
+
     """
+    if isinstance(async_scoped_session, AsyncSession):
+        return await async_scoped_session.execute(statement, params, **kwargs)
+
     async with async_scoped_session() as session:
         return await session.execute(statement, params, **kwargs)
+
+
+async def execute_many(
+    async_scoped_session: async_scoped_session[AsyncSession],
+    *statements: TypedReturnsRows[Any],
+) -> list[Result[Any]]:
+    """Execute several native SQLAlchemy statements in one session.
+
+    The statements are executed one after another within the same
+    session, so the connection is acquired only once instead of
+    once per statement.
+
+    .. note::
+        A session cannot run statements concurrently, so the
+        statements are not executed in parallel.
+
+    Examples
+    --------
+    >>> from sqlactive import DBConnection
+    >>> conn = DBConnection(DATABASE_URL, echo=True)
+    >>> ages_query = select(User.age, func.count(User.id)).group_by(User.age)
+    >>> names_query = select(User.name).where(User.age > 25)
+    >>> ages, names = await execute_many(
+    ...     conn.async_scoped_session, ages_query, names_query
+    ... )
+    >>> ages.all()
+    [(20, 1), (22, 4), (25, 12)]
+    >>> names.scalars().all()
+    ['Bob Williams', 'Jane Doe', ...]
+
+    """
+    async with async_scoped_session() as session:
+        return [await session.execute(statement) for statement in statements]
@@ -24,6 +24,9 @@ class SQLActiveError(Exception):
 class CompositePrimaryKeyError(SQLActiveError, ValueError):
     """Composite primary key."""
 
+    _template = 'model {class_name} has a composite primary key'
+    """Error message template."""
+
     def __init__(self, class_name: str, note: str = '') -> None:
         """Composite primary key.
 
@@ -35,12 +38,15 @@ class CompositePrimaryKeyError(SQLActiveError, ValueError):
             Additional note, by default ''.
 
         """
-        super().__init__(f'model {class_name} has a composite primary key', note)
+        super().__init__(self._template.format(class_name=class_name), note)
 
 
 class EagerLoadPathTupleError(SQLActiveError, ValueError):
     """Invalid eager load path tuple."""
 
+    _template = 'expected boolean for second element of tuple in {path!r}'
+    """Error message template."""
+
     def __init__(self, path: tuple[object, object], note: str = '') -> None:
         """Invalid eager load path tuple.
 
@@ -52,15 +58,15 @@ class EagerLoadPathTupleError(SQLActiveError, ValueError):
             Additional note, by default ''.
 
         """
-        super().__init__(
-            f'expected boolean for second element of tuple in {path!r}',
-            note,
-        )
+        super().__init__(self._template.format(path=path), note)
 
 
 class FilterTypeError(SQLActiveError, TypeError):
     """Invalid filter type."""
 
+    _template = 'expected dict or list in filters, got {type_name}: {filters!r}'
+    """Error message template."""
+
     def __init__(self, filters: object, note: str = '') -> None:
         """Invalid filter type.
 
@@ -73,8 +79,10 @@ class FilterTypeError(SQLActiveError, TypeError):
 
         """
         super().__init__(
-            f'expected dict or list in filters'
-            f', got {type(filters).__name__}: {filters!r}',
+            self._template.format(
+                type_name=type(filters).__name__,
+                filters=filters,
+            ),
             note,
         )
 
@@ -82,6 +90,9 @@ class FilterTypeError(SQLActiveError, TypeError):
 class InvalidJoinMethodError(SQLActiveError, ValueError):
     """Invalid join method."""
 
+    _template = 'invalid join method {join_method!r} for {attr_name!r}'
+    """Error message template."""
+
     def __init__(self, attr_name: str, join_method: str, note: str = '') -> None:
         """Invalid join method.
 
@@ -95,12 +106,18 @@ class InvalidJoinMethodError(SQLActiveError, ValueError):
             Additional note, by default ''.
 
         """
-        super().__init__(f'invalid join method {join_method!r} for {attr_name!r}', note)
+        super().__init__(
+            self._template.format(attr_name=attr_name, join_method=join_method),
+            note,
+        )
 
 
 class ModelAttributeError(SQLActiveError, AttributeError):
     """Attribute not found in model."""
 
+    _template = 'no such attribute: {attr_name!r} in model {class_name}'
+    """Error message template."""
+
     def __init__(self, attr_name: str, class_name: str, note: str = '') -> None:
         """Attribute not found in model.
 
@@ -115,7 +132,7 @@ class ModelAttributeError(SQLActiveError, AttributeError):
 
         """
         super().__init__(
-            f'no such attribute: {attr_name!r} in model {class_name}',
+            self._template.format(attr_name=attr_name, class_name=class_name),
             note,
         )
 
@@ -123,6 +140,9 @@ class ModelAttributeError(SQLActiveError, AttributeError):
 class NegativeIntegerError(SQLActiveError, ValueError):
     """Integer must be >= 0."""
 
+    _template = '{name} must be >= 0, got {value}'
+    """Error message template."""
+
     def __init__(self, name: str, value: int, note: str = '') -> None:
         """Offset must be >= 0.
 
@@ -136,12 +156,15 @@ class NegativeIntegerError(SQLActiveError, ValueError):
             Additional note, by default ''.
 
         """
-        super().__init__(f'{name} must be >= 0, got {value}', note)
+        super().__init__(self._template.format(name=name, value=value), note)
 
 
 class NoColumnOrHybridPropertyError(SQLActiveError, AttributeError):
     """Attribute is neither a column nor a hybrid property."""
 
+    _template = 'no such column or hybrid property: {attr_name!r} in model {class_name}'
+    """Error message template."""
+
     def __init__(self, attr_name: str, class_name: str, note: str = '') -> None:
         """Attribute is neither a column nor a hybrid property.
 
@@ -156,7 +179,7 @@ class NoColumnOrHybridPropertyError(SQLActiveError, AttributeError):
 
         """
         super().__init__(
-            f'no such column or hybrid property: {attr_name!r} in model {class_name}',
+            self._template.format(attr_name=attr_name, class_name=class_name),
             note,
         )
 
@@ -164,6 +187,9 @@ class NoColumnOrHybridPropertyError(SQLActiveError, AttributeError):
 class NoFilterableError(SQLActiveError, AttributeError):
     """Attribute not filterable."""
 
+    _template = 'attribute not filterable: {attr_name!r} in model {class_name}'
+    """Error message template."""
+
     def __init__(self, attr_name: str, class_name: str, note: str = '') -> None:
         """Attribute not filterable.
 
@@ -178,7 +204,7 @@ class NoFilterableError(SQLActiveError, AttributeError):
 
         """
         super().__init__(
-            f'attribute not filterable: {attr_name!r} in model {class_name}',
+            self._template.format(attr_name=attr_name, class_name=class_name),
             note,
         )
 
@@ -186,6 +212,9 @@ class NoFilterableError(SQLActiveError, AttributeError):
 class NoSessionError(SQLActiveError, RuntimeError):
     """No session available."""
 
+    _template = 'cannot get session; set_session() must be called first'
+    """Error message template."""
+
     def __init__(self, note: str = '') -> None:
         """No session available.
 
@@ -195,12 +224,15 @@ class NoSessionError(SQLActiveError, RuntimeError):
             Additional note, by default ''.
 
         """
-        super().__init__('cannot get session; set_session() must be called first', note)
+        super().__init__(self._template, note)
 
 
 class NoSearchableColumnsError(SQLActiveError, RuntimeError):
     """No searchable columns in model."""
 
+    _template = 'model {class_name} has no searchable columns'
+    """Error message template."""
+
     def __init__(self, class_name: str, note: str = '') -> None:
         """No searchable columns in model.
 
@@ -212,15 +244,15 @@ class NoSearchableColumnsError(SQLActiveError, RuntimeError):
             Additional note, by default ''.
 
         """
-        super().__init__(
-            f'model {class_name} has no searchable columns',
-            note,
-        )
+        super().__init__(self._template.format(class_name=class_name), note)
 
 
 class NoSearchableError(SQLActiveError, AttributeError):
     """Attribute not searchable."""
 
+    _template = 'attribute not searchable: {attr_name!r} in model {class_name}'
+    """Error message template."""
+
     def __init__(self, attr_name: str, class_name: str, note: str = '') -> None:
         """Attribute not searchable.
 
@@ -235,7 +267,7 @@ class NoSearchableError(SQLActiveError, AttributeError):
 
         """
         super().__init__(
-            f'attribute not searchable: {attr_name!r} in model {class_name}',
+            self._template.format(attr_name=attr_name, class_name=class_name),
             note,
         )
 
@@ -243,6 +275,9 @@ class NoSearchableError(SQLActiveError, AttributeError):
 class NoSettableError(SQLActiveError, AttributeError):
     """Attribute not settable."""
 
+    _template = 'attribute not settable: {attr_name!r} in model {class_name}'
+    """Error message template."""
+
     def __init__(self, attr_name: str, class_name: str, note: str = '') -> None:
         """Attribute not settable.
 
@@ -257,7 +292,7 @@ class NoSettableError(SQLActiveError, AttributeError):
 
         """
         super().__init__(
-            f'attribute not settable: {attr_name!r} in model {class_name}',
+            self._template.format(attr_name=attr_name, class_name=class_name),
             note,
         )
 
@@ -265,6 +300,9 @@ class NoSettableError(SQLActiveError, AttributeError):
 class NoSortableError(SQLActiveError, AttributeError):
     """Attribute not sortable."""
 
+    _template = 'attribute not sortable: {attr_name!r} in model {class_name}'
+    """Error message template."""
+
     def __init__(self, attr_name: str, class_name: str, note: str = '') -> None:
         """Attribute not sortable.
 
@@ -279,7 +317,7 @@ class NoSortableError(SQLActiveError, AttributeError):
 
         """
         super().__init__(
-            f'attribute not sortable: {attr_name!r} in model {class_name}',
+            self._template.format(attr_name=attr_name, class_name=class_name),
             note,
         )
 
@@ -287,6 +325,9 @@ class NoSortableError(SQLActiveError, AttributeError):
 class OperatorError(SQLActiveError, ValueError):
     """Operator not found."""
 
+    _template = 'no such operator: {op_name!r}'
+    """Error message template."""
+
     def __init__(self, op_name: str, note: str = '') -> None:
         """Operator not found.
 
@@ -298,12 +339,15 @@ class OperatorError(SQLActiveError, ValueError):
             Additional note, by default ''.
 
         """
-        super().__init__(f'no such operator: {op_name!r}', note)
+        super().__init__(self._template.format(op_name=op_name), note)
 
 
 class RelationError(SQLActiveError, AttributeError):
     """Relation not found."""
 
+    _template = 'no such relation: {relation_name!r} in model {class_name}'
+    """Error message template."""
+
     def __init__(self, relation_name: str, class_name: str, note: str = '') -> None:
         """Relation not found.
 
@@ -318,7 +362,7 @@ class RelationError(SQLActiveError, AttributeError):
 
         """
         super().__init__(
-            f'no such relation: {relation_name!r} in model {class_name}',
+            self._template.format(relation_name=relation_name, class_name=class_name),
             note,
         )
 
@@ -326,6 +370,9 @@ class RelationError(SQLActiveError, AttributeError):
 class RootClassNotFoundError(SQLActiveError, ValueError):
     """Root class not found."""
 
+    _template = 'could not find root class of query: {query}'
+    """Error message template."""
+
     def __init__(self, query: str, note: str = '') -> None:
         """Root class not found.
 
@@ -337,4 +384,4 @@ class RootClassNotFoundError(SQLActiveError, ValueError):
             Additional note, by default ''.
 
         """
-        super().__init__(f'could not find root class of query: {query}', note)
+        super().__init__(self._template.format(query=query), note)
@@ -4,16 +4,30 @@ Provides attributes and properties inspection functionality
 for SQLAlchemy models.
 """
 
+from collections.abc import Callable
 from numbers import Number
+from operator import attrgetter
 from typing import Any
 
+from sqlalchemy import event
 from sqlalchemy.ext.hybrid import hybrid_method, hybrid_property
-from sqlalchemy.orm import DeclarativeBase, RelationshipProperty
+from sqlalchemy.orm import DeclarativeBase, Mapper
 from sqlalchemy.sql.schema import Column
 
 from .exceptions import CompositePrimaryKeyError, RelationError
 from .types import Self
-from .utils import classproperty
+from .utils import cached_classproperty, classproperty
+
+
+def _format_key_value(key: str, template: str, value: object) -> str:
+    """Format a primary key value as ``key=value``.
+
+    ``None`` is never quoted.
+    """
+    if value is None:
+        return f'{key}=None'
+
+    return template.format(value)
 
 
 class InspectionMixin(DeclarativeBase):
@@ -52,15 +66,21 @@ class InspectionMixin(DeclarativeBase):
         'id=1, product_id=1'
 
         """
-        mapped = []
-        for pk in self.primary_keys_full:
-            value = getattr(self, pk.key)
-            mapped.append(
-                f'{pk.key}={value}'
-                if isinstance(value, Number) or value is None
-                else f'{pk.key}="{value}"',
-            )
-        return ', '.join(mapped)
+        templates = self._primary_key_templates
+        values = self._primary_key_getter(self)
+        if len(templates) == 1:
+            key, template = templates[0]
+            return _format_key_value(key, template, values)
+
+        return ', '.join(
+            _format_key_value(key, template, value)
+            for (key, template), value in zip(templates, values, strict=True)
+        )
+
+    @cached_classproperty
+    def _columns(cls) -> tuple[str, ...]:
+        """Return the column names, cached."""
+        return tuple(cls.__table__.columns.keys())
 
     @classproperty
     def columns(cls) -> list[str]:
@@ -82,7 +102,12 @@ class InspectionMixin(DeclarativeBase):
         ['id', 'username', 'name', 'age', 'created_at', 'updated_at']
 
         """
-        return cls.__table__.columns.keys()
+        return list(cls._columns)
+
+    @cached_classproperty
+    def _string_columns(cls) -> tuple[str, ...]:
+        """Return the string column names, cached."""
+        return tuple(c.key for c in cls.__table__.columns if c.type.python_type is str)
 
     @classproperty
     def string_columns(cls) -> list[str]:
@@ -104,9 +129,9 @@ class InspectionMixin(DeclarativeBase):
         ['username', 'name']
 
         """
-        return [c.key for c in cls.__table__.columns if c.type.python_type is str]
+        return list(cls._string_columns)
 
-    @classproperty
+    @cached_classproperty
     def primary_keys_full(cls) -> tuple[Column[Any], ...]:
         """Return the columns that form the primary key.
 
@@ -126,6 +151,11 @@ class InspectionMixin(DeclarativeBase):
         """
         return cls.__mapper__.primary_key
 
+    @cached_classproperty
+    def _primary_keys(cls) -> tuple[str, ...]:
+        """Return the names of the primary key columns, cached."""
+        return tuple(pk.key for pk in cls.primary_keys_full)
+
     @classproperty
     def primary_keys(cls) -> list[str]:
         """Return the names of the primary key columns.
@@ -144,9 +174,37 @@ class InspectionMixin(DeclarativeBase):
         ['id']
 
         """
-        return [pk.key for pk in cls.primary_keys_full]
+        return list(cls._primary_keys)
 
-    @classproperty
+    @cached_classproperty
+    def _primary_key_templates(cls) -> list[tuple[str, str]]:
+        """Return ``(key, template)`` pairs used to build ``id_str``.
+
+        Values of numeric columns are not quoted. Columns without
+        a known Python type are quoted.
+        """
+        templates = []
+        for pk in cls.primary_keys_full:
+            try:
+                numeric = issubclass(pk.type.python_type, Number)
+            except NotImplementedError:
+                numeric = False
+
+            template = f'{pk.key}={{}}' if numeric else f'{pk.key}="{{}}"'
+            templates.append((pk.key, template))
+
+        return templates
+
+    @cached_classproperty
+    def _primary_key_getter(cls) -> Callable[[object], Any]:
+        """Return a getter of the primary key values of an instance.
+
+        It returns a single value if the primary key is not composite,
+        and a tuple of values otherwise.
+        """
+        return attrgetter(*cls._primary_keys)
+
+    @cached_classproperty
     def primary_key_name(cls) -> str:
         """Return the primary key name of the model.
 
@@ -188,10 +246,35 @@ class InspectionMixin(DeclarativeBase):
         CompositePrimaryKeyError: model 'Sell' has a composite primary key
 
         """
-        if len(cls.primary_keys) > 1:
+        if len(cls._primary_keys) > 1:
             raise CompositePrimaryKeyError(cls.__name__)
 
-        return cls.primary_keys[0]
+        return cls._primary_keys[0]
+
+    @cached_classproperty
+    def _relation_names(cls) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """Return the relationship names and the settable ones.
+
+        Both are collected in a single pass over the relationships.
+        """
+        relations: list[str] = []
+        settable: list[str] = []
+        for relationship in cls.__mapper__.relationships:
+            relations.append(relationship.key)
+            if not relationship.viewonly:
+                settable.append(relationship.key)
+
+        return tuple(relations), tuple(settable)
+
+    @cached_classproperty
+    def _relations(cls) -> tuple[str, ...]:
+        """Return the relationship names, cached."""
+        return cls._relation_names[0]
+
+    @cached_classproperty
+    def _settable_relations(cls) -> tuple[str, ...]:
+        """Return the settable relationship names, cached."""
+        return cls._relation_names[1]
 
     @classproperty
     def relations(cls) -> list[str]:
@@ -217,9 +300,7 @@ class InspectionMixin(DeclarativeBase):
         ['posts', 'comments']
 
         """
-        return [
-            c.key for c in cls.__mapper__.attrs if isinstance(c, RelationshipProperty)
-        ]
+        return list(cls._relations)
 
     @classproperty
     def settable_relations(cls) -> list[str]:
@@ -260,7 +341,38 @@ class InspectionMixin(DeclarativeBase):
         []
 
         """
-        return [r for r in cls.relations if not getattr(cls, r).property.viewonly]
+        return list(cls._settable_relations)
+
+    @cached_classproperty
+    def _hybrid_attributes(
+        cls,
+    ) -> tuple[tuple[str, ...], dict[str, hybrid_method[..., Any]]]:
+        """Return the hybrid property names and the hybrid methods.
+
+        Both are collected in a single pass over the ORM descriptors.
+        """
+        properties: list[str] = []
+        methods: dict[str, hybrid_method[..., Any]] = {}
+        for item in cls.__mapper__.all_orm_descriptors:
+            if isinstance(item, hybrid_property):
+                properties.append(item.__name__)
+            elif isinstance(item, hybrid_method):
+                methods[item.func.__name__] = item
+
+        return tuple(properties), methods
+
+    @cached_classproperty
+    def _hybrid_properties(cls) -> tuple[str, ...]:
+        """Return the hybrid property names, cached."""
+        return cls._hybrid_attributes[0]
+
+    @cached_classproperty
+    def _hybrid_methods_full(cls) -> dict[str, hybrid_method[..., Any]]:
+        """Return the hybrid methods, cached.
+
+        The dict is shared, so it must not be mutated.
+        """
+        return cls._hybrid_attributes[1]
 
     @classproperty
     def hybrid_properties(cls) -> list[str]:
@@ -289,8 +401,7 @@ class InspectionMixin(DeclarativeBase):
         ['is_adult']
 
         """
-        items = cls.__mapper__.all_orm_descriptors
-        return [item.__name__ for item in items if isinstance(item, hybrid_property)]
+        return list(cls._hybrid_properties)
 
     @classproperty
     def hybrid_methods_full(cls) -> dict[str, hybrid_method[..., Any]]:
@@ -319,10 +430,7 @@ class InspectionMixin(DeclarativeBase):
         {'older_than': hybrid_method(...)}
 
         """
-        items = cls.__mapper__.all_orm_descriptors
-        return {
-            item.func.__name__: item for item in items if type(item) is hybrid_method
-        }
+        return dict(cls._hybrid_methods_full)
 
     @classproperty
     def hybrid_methods(cls) -> list[str]:
@@ -351,7 +459,17 @@ class InspectionMixin(DeclarativeBase):
         ['older_than']
 
         """
-        return list(cls.hybrid_methods_full.keys())
+        return list(cls._hybrid_methods_full)
+
+    @cached_classproperty
+    def _filterable_attributes(cls) -> tuple[str, ...]:
+        """Return the filterable attributes, cached."""
+        return (
+            cls._columns
+            + cls._relations
+            + cls._hybrid_properties
+            + tuple(cls._hybrid_methods_full)
+        )
 
     @classproperty
     def filterable_attributes(cls) -> list[str]:
@@ -391,7 +509,12 @@ class InspectionMixin(DeclarativeBase):
         ]
 
         """
-        return cls.columns + cls.relations + cls.hybrid_properties + cls.hybrid_methods
+        return list(cls._filterable_attributes)
+
+    @cached_classproperty
+    def _sortable_attributes(cls) -> tuple[str, ...]:
+        """Return the sortable attributes, cached."""
+        return cls._columns + cls._hybrid_properties
 
     @classproperty
     def sortable_attributes(cls) -> list[str]:
@@ -424,7 +547,12 @@ class InspectionMixin(DeclarativeBase):
         ['id', 'username', 'name', 'age', 'created_at', 'updated_at', 'is_adult']
 
         """
-        return cls.columns + cls.hybrid_properties
+        return list(cls._sortable_attributes)
+
+    @cached_classproperty
+    def _settable_attributes(cls) -> tuple[str, ...]:
+        """Return the settable attributes, cached."""
+        return cls._columns + cls._settable_relations + cls._hybrid_properties
 
     @classproperty
     def settable_attributes(cls) -> list[str]:
@@ -460,7 +588,7 @@ class InspectionMixin(DeclarativeBase):
         ]
 
         """
-        return cls.columns + cls.settable_relations + cls.hybrid_properties
+        return list(cls._settable_attributes)
 
     @classproperty
     def searchable_attributes(cls) -> list[str]:
@@ -484,7 +612,79 @@ class InspectionMixin(DeclarativeBase):
         ['username', 'name']
 
         """
-        return cls.string_columns
+        return list(cls._string_columns)
+
+    @cached_classproperty
+    def relations_set(cls) -> frozenset[str]:
+        """Return a set of relationship names.
+
+        Same as ``relations``, but as a frozenset
+        for fast membership tests.
+        """
+        return frozenset(cls._relations)
+
+    @cached_classproperty
+    def hybrid_methods_set(cls) -> frozenset[str]:
+        """Return a set of hybrid methods.
+
+        Same as ``hybrid_methods``, but as a frozenset
+        for fast membership tests.
+        """
+        return frozenset(cls._hybrid_methods_full)
+
+    @cached_classproperty
+    def filterable_attributes_set(cls) -> frozenset[str]:
+        """Return a set of filterable attributes.
+
+        Same as ``filterable_attributes``, but as a frozenset
+        for fast membership tests.
+        """
+        return frozenset(cls._filterable_attributes)
+
+    @cached_classproperty
+    def sortable_attributes_set(cls) -> frozenset[str]:
+        """Return a set of sortable attributes.
+
+        Same as ``sortable_attributes``, but as a frozenset
+        for fast membership tests.
+        """
+        return frozenset(cls._sortable_attributes)
+
+    @cached_classproperty
+    def settable_attributes_set(cls) -> frozenset[str]:
+        """Return a set of settable attributes.
+
+        Same as ``settable_attributes``, but as a frozenset
+        for fast membership tests.
+        """
+        return frozenset(cls._settable_attributes)
+
+    @cached_classproperty
+    def searchable_attributes_set(cls) -> frozenset[str]:
+        """Return a set of searchable attributes.
+
+        Same as ``searchable_attributes``, but as a frozenset
+        for fast membership tests.
+        """
+        return frozenset(cls._string_columns)
+
+    @classmethod
+    def _invalidate_inspection_cache(cls) -> None:
+        """Clear the cached inspection properties of the model.
+
+        Internal helper. Caches derived from the inspection
+        properties, such as the search attributes resolved by
+        ``SmartQueryMixin``, are rebuilt on their next use.
+        """
+        cached_classproperty.clear_all(cls)
+
+    @cached_classproperty
+    def _relation_classes(cls) -> dict[str, type[Self]]:
+        """Return a dict mapping relationship names to their classes."""
+        return {
+            name: relationship.mapper.class_
+            for name, relationship in cls.__mapper__.relationships.items()
+        }
 
     @classmethod
     def get_class_of_relation(cls, relation_name: str) -> type[Self]:
@@ -527,7 +727,7 @@ class InspectionMixin(DeclarativeBase):
 
         """
         try:
-            return cls.__mapper__.relationships[relation_name].mapper.class_
+            return cls._relation_classes[relation_name]
         except KeyError as e:
             raise RelationError(relation_name, cls.__name__) from e
 
@@ -548,4 +748,18 @@ class InspectionMixin(DeclarativeBase):
         [User(id=4), User(id=5)]
 
         """
-        return f'{self.__class__.__name__}({self.id_str})'
+        return f'{type(self).__name__}({self.id_str})'
+
+
+@event.listens_for(Mapper, 'after_configured')
+def _clear_inspection_caches() -> None:
+    """Clear the cached inspection properties of all the models.
+
+    Configuring new mappers may add properties (i.e. backrefs)
+    to models whose inspection properties were already cached.
+    """
+    classes: list[type] = [InspectionMixin]
+    while classes:
+        cls = classes.pop()
+        cached_classproperty.clear_all(cls)
+        classes.extend(cls.__subclasses__())
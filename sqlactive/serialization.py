@@ -75,19 +75,19 @@ class SerializationMixin(InspectionMixin):
         result = {}
 
         if exclude is None:
-            view_cols = self.columns
+            view_cols = self._columns
         else:
-            view_cols = filter(lambda e: e not in exclude, self.columns)
+            view_cols = filter(lambda e: e not in exclude, self._columns)
 
         for key in view_cols:
             result[key] = getattr(self, key, None)
 
         if hybrid_attributes:
-            for key in self.hybrid_properties:
+            for key in self._hybrid_properties:
                 result[key] = getattr(self, key, None)
 
         if nested:
-            for key in self.relations:
+            for key in self._relations:
                 try:
                     obj = getattr(self, key)
 
@@ -277,10 +277,10 @@ class SerializationMixin(InspectionMixin):
             if exclude is not None and name in exclude:
                 continue
 
-            if name in obj.hybrid_properties:
+            if name in obj._hybrid_properties:
                 continue
 
-            if name in obj.relations:
+            if name in obj._relations:
                 relation_class = cls.get_class_of_relation(name)
                 setattr(
                     obj,
@@ -289,7 +289,7 @@ class SerializationMixin(InspectionMixin):
                 )
                 continue
 
-            if name in obj.columns:
+            if name in obj._columns:
                 setattr(obj, name, data[name])
             else:
                 raise ModelAttributeError(name, cls.__name__)
@@ -6,15 +6,17 @@ query, making it easier to retrieve specific data from the database.
 """
 
 from collections.abc import Generator, Sequence
+from functools import lru_cache
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from sqlalchemy.orm import aliased
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 from sqlalchemy.orm.strategy_options import _AbstractLoad
 from sqlalchemy.orm.util import AliasedClass
-from sqlalchemy.sql import asc, desc, extract, operators
+from sqlalchemy.sql import asc, desc, extract, operators, or_
 from sqlalchemy.sql.elements import ColumnElement
-from sqlalchemy.sql.operators import OperatorType, or_
+from sqlalchemy.sql.operators import OperatorType
 
 from .exceptions import (
     NoColumnOrHybridPropertyError,
@@ -51,6 +53,19 @@ _OPERATOR_SPLITTER = '__'
 _DESC_PREFIX = '-'
 """Prefix used to mark descending order."""
 
+_SEARCH_ATTRS_CACHE: WeakKeyDictionary[
+    type[InspectionMixin],
+    tuple[
+        frozenset[str],
+        dict[tuple[str, ...] | None, tuple[InstrumentedAttribute[Any], ...]],
+    ],
+] = WeakKeyDictionary()
+"""Cache of resolved searchable attributes per model and columns.
+
+Each entry is tied to the ``searchable_attributes_set`` it was built
+from, so it is dropped when the inspection cache of the model is cleared.
+"""
+
 _OPERATORS: dict[str, OperationFunction | OperatorType] = {
     'isnull': lambda c, v: (c == None) if v else (c != None),  # noqa: E711
     'exact': operators.eq,
@@ -92,6 +107,55 @@ _OPERATORS: dict[str, OperationFunction | OperatorType] = {
 """Django-like operators mapping."""
 
 
+@lru_cache(maxsize=1024)
+def _split_relation_path(attr: str) -> tuple[str, str]:
+    """Split a Django-like attribute path into relation path and name.
+
+    The result is cached, since the same paths are usually parsed
+    many times.
+
+    Parameters
+    ----------
+    attr : str
+        Attribute path, i.e. ``'user___posts___title'``.
+
+    Returns
+    -------
+    tuple[str, str]
+        Relation path and attribute name,
+        i.e. ``('user___posts', 'title')``.
+
+    """
+    relation_path, _, attr_name = attr.rpartition(_RELATION_SPLITTER)
+    return relation_path, attr_name
+
+
+@lru_cache(maxsize=1024)
+def _split_operator(attr: str) -> tuple[str, str | None]:
+    """Split a Django-like filter key into attribute and operator names.
+
+    The result is cached, since the same filter keys are usually
+    parsed many times.
+
+    Parameters
+    ----------
+    attr : str
+        Filter key, i.e. ``'rating__gt'`` or ``'rating'``.
+
+    Returns
+    -------
+    tuple[str, str | None]
+        Attribute and operator names, i.e. ``('rating', 'gt')``.
+        The operator name is None if the key has no operator.
+
+    """
+    if _OPERATOR_SPLITTER not in attr:
+        return attr, None
+
+    attr_name, op_name = attr.rsplit(_OPERATOR_SPLITTER, 1)
+    return attr_name, op_name
+
+
 class SmartQueryMixin(InspectionMixin):
     """Mixin for SQLAlchemy models to provide smart query methods."""
 
@@ -230,10 +294,11 @@ class SmartQueryMixin(InspectionMixin):
         mapper, _class = cls._get_mapper()
 
         expressions = []
-        valid_attributes = _class.filterable_attributes
+        valid_attributes = _class.filterable_attributes_set
+        hybrid_methods = _class.hybrid_methods_set
         for attr, value in filters.items():
             # if attribute is filtered by method, call this method
-            if attr in _class.hybrid_methods:
+            if attr in hybrid_methods:
                 method = getattr(_class, attr)
                 expressions.append(method(value))
 
@@ -242,8 +307,8 @@ class SmartQueryMixin(InspectionMixin):
             else:
                 # determine attribute name and operator
                 # if they are explicitly set (say, id__between), take them
-                if _OPERATOR_SPLITTER in attr:
-                    attr_name, op_name = attr.rsplit(_OPERATOR_SPLITTER, 1)
+                attr_name, op_name = _split_operator(attr)
+                if op_name is not None:
                     op = _OPERATORS.get(op_name)
                     if not op:
                         raise OperatorError(
@@ -253,7 +318,7 @@ class SmartQueryMixin(InspectionMixin):
 
                 # assume equality operator for other cases (say, id=1)
                 else:
-                    attr_name, op = attr, operators.eq
+                    op = operators.eq
 
                 if attr_name not in valid_attributes:
                     raise NoFilterableError(
@@ -355,7 +420,7 @@ class SmartQueryMixin(InspectionMixin):
             fn, attr_name = (
                 (desc, attr[1:]) if attr.startswith(_DESC_PREFIX) else (asc, attr)
             )
-            if attr_name not in _class.sortable_attributes:
+            if attr_name not in _class.sortable_attributes_set:
                 raise NoSortableError(attr_name, _class.__name__)
 
             expr = fn(getattr(mapper, attr_name))
@@ -459,7 +524,7 @@ class SmartQueryMixin(InspectionMixin):
 
         expressions: list[ColumnElement[Any]] = []
         for attr in columns:
-            if attr not in _class.sortable_attributes:
+            if attr not in _class.sortable_attributes_set:
                 raise NoColumnOrHybridPropertyError(attr, _class.__name__)
 
             expressions.append(getattr(mapper, attr))
@@ -704,24 +769,12 @@ class SmartQueryMixin(InspectionMixin):
         """
         root_cls = get_query_root_cls(query, raise_on_none=True)
 
-        searchable_columns = cls._get_searchable_columns(root_cls, columns)
-        if not searchable_columns:
+        search_attrs = cls._get_search_attrs(root_cls, columns)
+        if not search_attrs:
             raise NoSearchableColumnsError(root_cls.__name__)
 
-        if len(searchable_columns) > 1:
-            search_conditions = [
-                getattr(root_cls, col).ilike(f'%{search_term}%')
-                for col in searchable_columns
-            ]
-
-            criteria = or_(search_conditions.pop(0), search_conditions.pop(0))
-            while search_conditions:
-                criteria = or_(criteria, search_conditions.pop(0))
-        else:
-            criteria = getattr(root_cls, searchable_columns[0]).ilike(
-                f'%{search_term}%',
-            )
-
+        pattern = f'%{search_term}%'
+        criteria = or_(*(attr.ilike(pattern) for attr in search_attrs))
         return query.filter(criteria)  # type: ignore
 
     @classmethod
@@ -771,6 +824,54 @@ class SmartQueryMixin(InspectionMixin):
 
         return aliases
 
+    @classmethod
+    def _get_search_attrs(
+        cls,
+        root_cls: type[InspectionMixin],
+        columns: Sequence[str | InstrumentedAttribute[Any]] | None = None,
+    ) -> tuple[InstrumentedAttribute[Any], ...]:
+        """Return the model attributes to search in.
+
+        The attributes are resolved once per model and columns,
+        and then cached.
+
+        Parameters
+        ----------
+        root_cls : type[InspectionMixin]
+            Model class.
+        columns : Sequence[str  |  InstrumentedAttribute[Any]] | None, optional
+            Columns to search in, by default None.
+
+        Returns
+        -------
+        tuple[InstrumentedAttribute[Any], ...]
+            Searchable attributes.
+
+        Raises
+        ------
+        NoSearchableError
+            If column is not searchable.
+
+        """
+        key = (
+            tuple(col if isinstance(col, str) else col.key for col in columns)
+            if columns
+            else None
+        )
+        searchable = root_cls.searchable_attributes_set
+        entry = _SEARCH_ATTRS_CACHE.get(root_cls)
+        if entry is None or entry[0] is not searchable:
+            entry = _SEARCH_ATTRS_CACHE[root_cls] = (searchable, {})
+
+        cache = entry[1]
+        if key not in cache:
+            cache[key] = tuple(
+                getattr(root_cls, col)
+                for col in cls._get_searchable_columns(root_cls, key)
+            )
+
+        return cache[key]
+
     @staticmethod
     def _get_searchable_columns(
         root_cls: type[InspectionMixin],
@@ -802,7 +903,7 @@ class SmartQueryMixin(InspectionMixin):
         if columns:
             for col in columns:
                 col_name = col if isinstance(col, str) else col.key
-                if col_name not in root_cls.searchable_attributes:
+                if col_name not in root_cls.searchable_attributes_set:
                     raise NoSearchableError(col_name, root_cls.__name__)
 
                 searchable_columns.append(col_name)
@@ -835,7 +936,7 @@ class SmartQueryMixin(InspectionMixin):
                     'user___name',
                     'post___name'
                 ],
-                aliases=OrderedDict()
+                aliases={}
             )
 
         Sample output:
@@ -883,7 +984,7 @@ class SmartQueryMixin(InspectionMixin):
                 if entity_path
                 else relation_name
             )
-            if relation_name not in entity.relations:
+            if relation_name not in entity.relations_set:
                 raise RelationError(
                     relation_name,
                     entity.__name__,
@@ -953,8 +1054,8 @@ class SmartQueryMixin(InspectionMixin):
                     continue
 
                 if _RELATION_SPLITTER in attr:
-                    parts = attr.rsplit(_RELATION_SPLITTER, 1)
-                    entity, attr_name = aliases[parts[0]][0], parts[1]
+                    relation_path, attr_name = _split_relation_path(attr)
+                    entity = aliases[relation_path][0]
                 else:
                     entity, attr_name = root_cls, attr
 
@@ -984,9 +1085,9 @@ class SmartQueryMixin(InspectionMixin):
             query = cls._sort_query(
                 query=query,
                 sort_attrs=['-created_at', 'user___name'],
-                aliases=OrderedDict({
+                aliases={
                     'user': (aliased(User), Post.user),
-                })
+                }
             )
 
         Sample output::
@@ -1020,8 +1121,8 @@ class SmartQueryMixin(InspectionMixin):
                 if col.startswith(_DESC_PREFIX):
                     prefix = _DESC_PREFIX
                     col = col.lstrip(_DESC_PREFIX)
-                parts = col.rsplit(_RELATION_SPLITTER, 1)
-                entity, attr_name = aliases[parts[0]][0], prefix + parts[1]
+                relation_path, attr_name = _split_relation_path(col)
+                entity, attr_name = aliases[relation_path][0], prefix + attr_name
             else:
                 entity, attr_name = root_cls, attr
 
@@ -1049,9 +1150,9 @@ class SmartQueryMixin(InspectionMixin):
             query = cls._group_query(
                 query=query,
                 group_attrs=['rating', 'user___name'],
-                aliases=OrderedDict({
+                aliases={
                     'user': (aliased(User), Post.user),
-                })
+                }
             )
 
         Sample output::
@@ -1080,8 +1181,8 @@ class SmartQueryMixin(InspectionMixin):
         """
         for attr in group_attrs:
             if _RELATION_SPLITTER in attr:
-                parts = attr.rsplit(_RELATION_SPLITTER, 1)
-                entity, attr_name = aliases[parts[0]][0], parts[1]
+                relation_path, attr_name = _split_relation_path(attr)
+                entity = aliases[relation_path][0]
             else:
                 entity, attr_name = root_cls, attr
 
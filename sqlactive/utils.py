@@ -35,6 +35,67 @@ class classproperty(Generic[T]):  # noqa: N801
         return self.fget(owner_cls)
 
 
+_CACHE_ATTR = '_classproperty_cache'
+"""Name of the class attribute holding the cached class properties."""
+
+
+class cached_classproperty(classproperty[T]):  # noqa: N801
+    """Decorator for a cached Class-level property.
+
+    The value is computed on first access and then stored
+    in a single private dict of the class (subclasses get
+    their own dict), so later accesses are plain dict lookups.
+
+    .. warning::
+        The cached value is shared, so it must not be mutated.
+
+    Usage:
+    >>> class Foo:
+    ...     @cached_classproperty
+    ...     def foo(cls):
+    ...         print('computing...')
+    ...         return 'foo'
+    >>> Foo.foo
+    computing...
+    'foo'
+    >>> Foo.foo
+    'foo'
+    """
+
+    name: str
+    """Key of the cached value."""
+
+    def __init__(self, func: Callable[[Any], T]) -> None:
+        super().__init__(func)
+        self.name = func.__name__
+
+    def __get__(self, _: object, owner_cls: type | None = None) -> T:
+        try:
+            return owner_cls.__dict__[_CACHE_ATTR][self.name]  # type: ignore
+        except KeyError:
+            cache = owner_cls.__dict__.get(_CACHE_ATTR)  # type: ignore
+            if cache is None:
+                cache = {}
+                # bypass the ``__setattr__`` of declarative classes
+                type.__setattr__(owner_cls, _CACHE_ATTR, cache)  # type: ignore
+
+            value = cache[self.name] = self.fget(owner_cls)
+            return value
+
+    @staticmethod
+    def clear_all(owner_cls: type) -> None:
+        """Clear all the cached values of the given class.
+
+        Parameters
+        ----------
+        owner_cls : type
+            The class whose cached values are cleared.
+
+        """
+        if _CACHE_ATTR in owner_cls.__dict__:
+            type.__delattr__(owner_cls, _CACHE_ATTR)
+
+
 @overload
 def get_query_root_cls(query: Query[T], raise_on_none: Literal[True]) -> type[T]: ...
 
@@ -0,0 +1,30 @@
+"""Test case running all async tests of a class on one event loop."""
+
+import asyncio
+import inspect
+import unittest
+
+
+class AsyncTestCase(unittest.TestCase):
+    """Test case that runs its ``async def`` tests on a class-wide loop.
+
+    Unlike ``unittest.IsolatedAsyncioTestCase``, the event loop is
+    created once in ``setUpClass`` and shared by every test of the
+    class, so the DB connection and its aiosqlite worker thread are
+    reused. Subclasses overriding ``setUpClass`` must call ``super()``
+    and register their own teardown with ``addClassCleanup``, so it
+    runs before the loop is closed.
+    """
+
+    loop: asyncio.AbstractEventLoop
+
+    @classmethod
+    def setUpClass(cls):
+        cls.loop = asyncio.new_event_loop()
+        cls.addClassCleanup(cls.loop.close)
+
+    def _callTestMethod(self, method):
+        if inspect.iscoroutinefunction(method):
+            self.loop.run_until_complete(method())
+        else:
+            method()
@@ -1,10 +1,11 @@
 """Logger for testing."""
 
 import logging
+import os
 
 from colorlog import ColoredFormatter
 
-LOG_LEVEL = logging.DEBUG
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'DEBUG').upper()
 LOG_FORMAT = (
     '  %(log_color)s%(levelname)-8s%(reset)s | %(log_color)s%(message)s%(reset)s'
 )
@@ -19,7 +20,9 @@ stream.setFormatter(formatter)
 def get_logger(name: str | None = None):
     logger = logging.getLogger(name)
     logger.setLevel(LOG_LEVEL)
-    logger.addHandler(stream)
+    if stream not in logger.handlers:
+        logger.addHandler(stream)
+    logger.propagate = False
     return logger
 
 
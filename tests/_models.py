@@ -3,7 +3,7 @@
 from typing import Optional
 from sqlalchemy import ForeignKey, String
 from sqlalchemy.ext.hybrid import hybrid_method, hybrid_property
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import DynamicMapped, Mapped, mapped_column, relationship
 
 from sqlactive.base_model import ActiveRecordBaseModel
 
@@ -77,3 +77,22 @@ class Sell(BaseModel):
     quantity: Mapped[int] = mapped_column(nullable=False)
 
     product: Mapped['Product'] = relationship(back_populates='sells')
+
+
+class Category(BaseModel):
+    __tablename__ = 'categories'
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True, index=True)
+    name: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    items: DynamicMapped['Item'] = relationship(back_populates='category', lazy='dynamic')
+
+
+class Item(BaseModel):
+    __tablename__ = 'items'
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True, index=True)
+    name: Mapped[str] = mapped_column(String(50), nullable=False)
+    category_id: Mapped[Optional[int]] = mapped_column(ForeignKey('categories.id'))
+
+    category: Mapped[Optional['Category']] = relationship(back_populates='items')
@@ -1,11 +1,134 @@
 """``Seed`` class to seed database with test data."""
 
+from itertools import islice
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from sqlactive.base_model import ActiveRecordBaseModel
 from sqlactive.conn import DBConnection
 
 from ._logger import logger
 from ._models import Comment, Post, Product, Sell, User
 
+_BATCH_SIZE = 1000
+
+_TITLE = 'Lorem ipsum'
+_LOREM = 'Lorem ipsum dolor sit amet, consectetur adipiscing elit.'
+
+_USERS_COLUMNS = ('id', 'username', 'name', 'age')
+_USERS = (
+    (1, 'Bob28', 'Bob Williams', 30),
+    (2, 'Bill65', 'Bill Smith', 40),
+    (3, 'Joe156', 'Joe Smith', 26),
+    (4, 'Jane54', 'Jane Doe', 25),
+    (5, 'John84', 'John Doe', 19),
+    (6, 'Jenny654', 'Jenny Wayne', 35),
+    (7, 'Jim32', 'Jim Collins', 36),
+    (8, 'Jimmy156', 'Jimmy Henderson', 27),
+    (9, 'Maria564', 'Maria Tillman', 28),
+    (10, 'Jill874', 'Jill Peterson', 34),
+    (11, 'Mike54', 'Mike Turner', 29),
+    (12, 'Molly565', 'Molly Anderson', 30),
+    (13, 'Alice5262', 'Alice Anderson', 24),
+    (14, 'David32', 'David Washington', 25),
+    (15, 'Helen12', 'Helen Walker', 31),
+    (16, 'Diana84', 'Diana Johnson', 26),
+    (17, 'Frank564', 'Frank Gardner', 28),
+    (18, 'Jack321', 'Jack Sparrow', 33),
+    (19, 'George3241', 'George Washington', 29),
+    (20, 'Harry847', 'Harry Potter', 30),
+    (21, 'Ian48', 'Ian Levitt', 32),
+    (22, 'Edward7656', 'Edward Norton', 27),
+    (23, 'Johnny665', 'Johnny Depp', 28),
+    (24, 'Tom897', 'Tom Cruise', 35),
+    (25, 'Brad654', 'Brad Pitt', 36),
+    (26, 'Angel8499', 'Angel Eyes', 31),
+    (27, 'Bruce984', 'Bruce Willis', 33),
+    (28, 'Matt954', 'Matt Damon', 30),
+    (29, 'George341854', 'George Mason', 29),
+    (30, 'Emily894', 'Emily Watson', 27),
+    (31, 'Kate6485', 'Kate Middleton', 28),
+    (32, 'Jennifer5215', 'Jennifer Lawrence', 31),
+    (33, 'Jessica3248', 'Jessica Alba', 30),
+    (34, 'Lily9845', 'Lily Collins', 29),
+)
+
+_POSTS_COLUMNS = ('id', 'title', 'body', 'rating', 'user_id')
+_POSTS = (
+    (1, _TITLE, _LOREM, 4, 1),
+    (2, _TITLE, _LOREM, 3, 2),
+    (3, _TITLE, _LOREM, 2, 3),
+    (4, _TITLE, _LOREM, 1, 4),
+    (5, _TITLE, _LOREM, 5, 5),
+    (6, _TITLE, _LOREM, 4, 6),
+    (7, _TITLE, _LOREM, 3, 7),
+    (8, _TITLE, _LOREM, 2, 8),
+    (9, _TITLE, _LOREM, 1, 9),
+    (10, _TITLE, _LOREM, 5, 10),
+    (11, _TITLE, _LOREM, 4, 11),
+    (12, _TITLE, _LOREM, 3, 12),
+    (13, _TITLE, _LOREM, 2, 13),
+    (14, _TITLE, _LOREM, 1, 14),
+    (15, _TITLE, _LOREM, 5, 15),
+    (16, _TITLE, _LOREM, 4, 16),
+    (17, _TITLE, _LOREM, 3, 17),
+    (18, _TITLE, _LOREM, 2, 18),
+    (19, _TITLE, _LOREM, 1, 19),
+    (20, _TITLE, _LOREM, 5, 20),
+    (21, _TITLE, _LOREM, 4, 21),
+    (22, _TITLE, _LOREM, 3, 22),
+    (23, _TITLE, _LOREM, 2, 23),
+    (24, _TITLE, _LOREM, 1, 24),
+)
+
+_COMMENTS_COLUMNS = ('id', 'body', 'post_id', 'user_id')
+_COMMENTS = (
+    (1, _LOREM, 1, 1),
+    (2, _LOREM, 2, 1),
+    (3, _LOREM, 2, 2),
+    (4, _LOREM, 3, 2),
+    (5, _LOREM, 4, 4),
+    (6, _LOREM, 4, 5),
+    (7, _LOREM, 4, 6),
+    (8, _LOREM, 4, 7),
+    (9, _LOREM, 7, 7),
+    (10, _LOREM, 7, 8),
+    (11, _LOREM, 7, 9),
+    (12, _LOREM, 1, 10),
+    (13, _LOREM, 2, 11),
+    (14, _LOREM, 9, 11),
+    (15, _LOREM, 9, 12),
+    (16, _LOREM, 9, 13),
+    (17, _LOREM, 9, 14),
+)
+
+_PRODUCTS_COLUMNS = ('id', 'name', 'description', 'price')
+_PRODUCTS = (
+    (1, 'Product 1', 'Description 1', 10.0),
+    (2, 'Product 2', 'Description 2', 20.0),
+    (3, 'Product 3', 'Description 3', 30.0),
+    (4, 'Product 4', 'Description 4', 40.0),
+    (5, 'Product 5', 'Description 5', 50.0),
+    (6, 'Product 6', 'Description 6', 60.0),
+    (7, 'Product 7', 'Description 7', 70.0),
+    (8, 'Product 8', 'Description 8', 80.0),
+)
+
+_SELLS_COLUMNS = ('id', 'product_id', 'quantity')
+_SELLS = (
+    (1, 1, 2),
+    (2, 2, 2),
+    (3, 3, 5),
+    (4, 4, 4),
+    (5, 5, 3),
+    (6, 6, 4),
+    (7, 7, 1),
+    (8, 8, 4),
+)
+
 
 class Seed:
     def __init__(
@@ -26,331 +149,49 @@ class Seed:
         self.base_model = base_model
 
     async def run(self):
-        """Seeds the database with test data."""
-        logger.info('Initializing database...')
+        """Seeds the database with test data in a single transaction."""
+        start = perf_counter()
         await self.conn.init_db(self.base_model)
-        logger.info('Seeding users...')
-        await self.seed_users()
-        logger.info('Seeding posts...')
-        await self.seed_posts()
-        logger.info('Seeding comments...')
-        await self.seed_comments()
-        logger.info('Seeding products...')
-        await self.seed_products()
-        logger.info('Seeding sells...')
-        await self.seed_sells()
-        logger.info('Database seeded.')
+        async with self.conn.async_scoped_session() as session, session.begin():
+            await self.seed_users(session)
+            await self.seed_posts(session)
+            await self.seed_comments(session)
+            await self.seed_products(session)
+            await self.seed_sells(session)
+        logger.info('Database seeded in %.3fs.', perf_counter() - start)
+
+    async def _insert(
+        self,
+        session: AsyncSession,
+        model: type[ActiveRecordBaseModel],
+        columns: tuple[str, ...],
+        values: tuple[tuple[Any, ...], ...],
+    ):
+        """Inserts the given rows with bulk ``INSERT`` statements.
+
+        Rows are built lazily and sent in batches of ``_BATCH_SIZE``.
+        They are committed with the transaction of the session.
+        """
+        rows = (dict(zip(columns, row)) for row in values)
+        while batch := list(islice(rows, _BATCH_SIZE)):
+            await session.execute(insert(model.__table__), batch)
 
-    async def seed_users(self):
+    async def seed_users(self, session: AsyncSession):
         """Seeds the database with test users."""
-        await User.insert_all(
-            [
-                User(username='Bob28', name='Bob Williams', age=30),
-                User(username='Bill65', name='Bill Smith', age=40),
-                User(username='Joe156', name='Joe Smith', age=26),
-                User(username='Jane54', name='Jane Doe', age=25),
-                User(username='John84', name='John Doe', age=19),
-                User(username='Jenny654', name='Jenny Wayne', age=35),
-                User(username='Jim32', name='Jim Collins', age=36),
-                User(username='Jimmy156', name='Jimmy Henderson', age=27),
-                User(username='Maria564', name='Maria Tillman', age=28),
-                User(username='Jill874', name='Jill Peterson', age=34),
-                User(username='Mike54', name='Mike Turner', age=29),
-                User(username='Molly565', name='Molly Anderson', age=30),
-                User(username='Alice5262', name='Alice Anderson', age=24),
-                User(username='David32', name='David Washington', age=25),
-                User(username='Helen12', name='Helen Walker', age=31),
-                User(username='Diana84', name='Diana Johnson', age=26),
-                User(username='Frank564', name='Frank Gardner', age=28),
-                User(username='Jack321', name='Jack Sparrow', age=33),
-                User(username='George3241', name='George Washington', age=29),
-                User(username='Harry847', name='Harry Potter', age=30),
-                User(username='Ian48', name='Ian Levitt', age=32),
-                User(username='Edward7656', name='Edward Norton', age=27),
-                User(username='Johnny665', name='Johnny Depp', age=28),
-                User(username='Tom897', name='Tom Cruise', age=35),
-                User(username='Brad654', name='Brad Pitt', age=36),
-                User(username='Angel8499', name='Angel Eyes', age=31),
-                User(username='Bruce984', name='Bruce Willis', age=33),
-                User(username='Matt954', name='Matt Damon', age=30),
-                User(username='George341854', name='George Mason', age=29),
-                User(username='Emily894', name='Emily Watson', age=27),
-                User(username='Kate6485', name='Kate Middleton', age=28),
-                User(username='Jennifer5215', name='Jennifer Lawrence', age=31),
-                User(username='Jessica3248', name='Jessica Alba', age=30),
-                User(username='Lily9845', name='Lily Collins', age=29),
-            ]
-        )
+        await self._insert(session, User, _USERS_COLUMNS, _USERS)
 
-    async def seed_posts(self):
+    async def seed_posts(self, session: AsyncSession):
         """Seeds the database with test posts."""
-        await Post.insert_all(
-            [
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=4,
-                    user_id=1,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=3,
-                    user_id=2,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=2,
-                    user_id=3,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=1,
-                    user_id=4,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=5,
-                    user_id=5,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=4,
-                    user_id=6,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=3,
-                    user_id=7,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=2,
-                    user_id=8,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=1,
-                    user_id=9,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=5,
-                    user_id=10,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=4,
-                    user_id=11,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=3,
-                    user_id=12,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=2,
-                    user_id=13,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=1,
-                    user_id=14,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=5,
-                    user_id=15,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=4,
-                    user_id=16,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=3,
-                    user_id=17,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=2,
-                    user_id=18,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=1,
-                    user_id=19,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=5,
-                    user_id=20,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=4,
-                    user_id=21,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=3,
-                    user_id=22,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=2,
-                    user_id=23,
-                ),
-                Post(
-                    title='Lorem ipsum',
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    rating=1,
-                    user_id=24,
-                ),
-            ]
-        )
+        await self._insert(session, Post, _POSTS_COLUMNS, _POSTS)
 
-    async def seed_comments(self):
+    async def seed_comments(self, session: AsyncSession):
         """Seeds the database with test comments."""
-        await Comment.insert_all(
-            [
-                Comment(
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    post_id=1,
-                    user_id=1,
-                ),
-                Comment(
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    post_id=2,
-                    user_id=1,
-                ),
-                Comment(
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    post_id=2,
-                    user_id=2,
-                ),
-                Comment(
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    post_id=3,
-                    user_id=2,
-                ),
-                Comment(
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    post_id=4,
-                    user_id=4,
-                ),
-                Comment(
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    post_id=4,
-                    user_id=5,
-                ),
-                Comment(
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    post_id=4,
-                    user_id=6,
-                ),
-                Comment(
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    post_id=4,
-                    user_id=7,
-                ),
-                Comment(
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    post_id=7,
-                    user_id=7,
-                ),
-                Comment(
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    post_id=7,
-                    user_id=8,
-                ),
-                Comment(
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    post_id=7,
-                    user_id=9,
-                ),
-                Comment(
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    post_id=1,
-                    user_id=10,
-                ),
-                Comment(
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    post_id=2,
-                    user_id=11,
-                ),
-                Comment(
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    post_id=9,
-                    user_id=11,
-                ),
-                Comment(
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    post_id=9,
-                    user_id=12,
-                ),
-                Comment(
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    post_id=9,
-                    user_id=13,
-                ),
-                Comment(
-                    body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
-                    post_id=9,
-                    user_id=14,
-                ),
-            ]
-        )
+        await self._insert(session, Comment, _COMMENTS_COLUMNS, _COMMENTS)
 
-    async def seed_products(self):
+    async def seed_products(self, session: AsyncSession):
         """Seeds the database with test products."""
-        await Product.insert_all(
-            [
-                Product(name='Product 1', description='Description 1', price=10.0),
-                Product(name='Product 2', description='Description 2', price=20.0),
-                Product(name='Product 3', description='Description 3', price=30.0),
-                Product(name='Product 4', description='Description 4', price=40.0),
-                Product(name='Product 5', description='Description 5', price=50.0),
-                Product(name='Product 6', description='Description 6', price=60.0),
-                Product(name='Product 7', description='Description 7', price=70.0),
-                Product(name='Product 8', description='Description 8', price=80.0),
-            ]
-        )
+        await self._insert(session, Product, _PRODUCTS_COLUMNS, _PRODUCTS)
 
-    async def seed_sells(self):
+    async def seed_sells(self, session: AsyncSession):
         """Seeds the database with test sells."""
-        await Sell.insert_all(
-            [
-                Sell(id=1, product_id=1, quantity=2),
-                Sell(id=2, product_id=2, quantity=2),
-                Sell(id=3, product_id=3, quantity=5),
-                Sell(id=4, product_id=4, quantity=4),
-                Sell(id=5, product_id=5, quantity=3),
-                Sell(id=6, product_id=6, quantity=4),
-                Sell(id=7, product_id=7, quantity=1),
-                Sell(id=8, product_id=8, quantity=4),
-            ]
-        )
+        await self._insert(session, Sell, _SELLS_COLUMNS, _SELLS)
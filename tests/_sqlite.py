@@ -0,0 +1,11 @@
+"""SQLite helpers for the test databases."""
+
+
+def set_pragmas(dbapi_connection, _):
+    """Tunes SQLite for the in-memory test database."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=MEMORY')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA cache_size=-64000')
+    cursor.close()
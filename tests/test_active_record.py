@@ -1,8 +1,7 @@
-import asyncio
-import unittest
 import warnings
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
+from sqlalchemy import event
 from sqlalchemy.exc import (
     IntegrityError,
     InvalidRequestError,
@@ -10,6 +9,7 @@ from sqlalchemy.exc import (
     NoResultFound,
 )
 from sqlalchemy.orm import joinedload, subqueryload
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.sql import text
 from sqlalchemy.sql.functions import func
 from sqlalchemy.sql.operators import or_
@@ -27,31 +27,40 @@ from sqlactive.exceptions import (
     RelationError,
 )
 
+from ._asynccase import AsyncTestCase
 from ._logger import logger
-from ._models import BaseModel, Comment, Post, Sell, User
+from ._models import BaseModel, Category, Comment, Item, Post, Sell, User
 from ._seed import Seed
+from ._sqlite import set_pragmas
 
 
-class TestActiveRecordMixin(unittest.IsolatedAsyncioTestCase):
+def utcnow() -> datetime:
+    """Returns the naive UTC time truncated to seconds, like SQLite's."""
+    return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
+
+class TestActiveRecordMixin(AsyncTestCase):
     """Tests for ``sqlactive.active_record.ActiveRecordMixin``."""
 
     DB_URL = 'sqlite+aiosqlite://'
 
     @classmethod
     def setUpClass(cls):
+        super().setUpClass()
         warnings.filterwarnings('ignore', category=DeprecationWarning)
 
         logger.info('***** ActiveRecordMixin tests *****')
         logger.info('Creating DB connection...')
-        cls.conn = DBConnection(cls.DB_URL, echo=False)
+        cls.conn = DBConnection(cls.DB_URL, echo=False, poolclass=StaticPool)
+        event.listen(cls.conn.async_engine.sync_engine, 'connect', set_pragmas)
+        cls.addClassCleanup(cls.close_connection)
         seed = Seed(cls.conn, BaseModel)
-        asyncio.run(seed.run())
+        cls.loop.run_until_complete(seed.run())
 
     @classmethod
-    def tearDownClass(cls):
-        if hasattr(cls, 'conn'):
-            logger.info('Closing DB connection...')
-            asyncio.run(cls.conn.close())
+    def close_connection(cls):
+        logger.info('Closing DB connection...')
+        cls.loop.run_until_complete(cls.conn.close())
 
     async def test_context_manager(self):
         """Test for ``__enter__`` and ``__exit__`` methods."""
@@ -65,57 +74,16 @@ class TestActiveRecordMixin(unittest.IsolatedAsyncioTestCase):
         self.assertIsNone(await User.get(user_id))
         self.assertEqual(34, len(await User.all()))
 
-    def test_getitem(self):
-        """Test for ``__getitem__`` method."""
-        logger.info('Testing "__getitem__" method...')
-        user = User(username='Test1000', name='Test User', age=20)
-        self.assertEqual('Test1000', user['username'])
-        self.assertEqual('Test User', user['name'])
-        self.assertEqual(20, user['age'])
-        with self.assertRaises(ModelAttributeError):
-            user['foo']
-
-    def test_setitem(self):
-        """Test for ``__setitem__`` method."""
-        logger.info('Testing "__setitem__" method...')
-        user = User(username='Test1000', name='Test User', age=20)
-        user['name'] = 'Test User 2'
-        self.assertEqual('Test User 2', user.name)
-        user['age'] = 30
-        self.assertEqual(30, user.age)
-        with self.assertRaises(ModelAttributeError):
-            user['foo'] = 'bar'
-        with self.assertRaises(NoSettableError):
-            user['older_than'] = True
-
-    def test_get_primary_key_name(self):
-        """Test for ``_get_primary_key_name`` function."""
-        logger.info('Testing "_get_primary_key_name" function...')
-        with self.assertRaises(CompositePrimaryKeyError):
-            Sell.get_primary_key_name()
-
-    def test_fill(self):
-        """Test for ``fill`` function."""
-        logger.info('Testing "fill" function...')
-        user = User(username='Bob28', name='Bob', age=30)
-        user.fill(**{'name': 'Bob Williams', 'age': 32})
-        self.assertEqual('Bob28', user.username)
-        self.assertEqual('Bob Williams', user.name)
-        self.assertEqual(32, user.age)
-        with self.assertRaises(ModelAttributeError):
-            user.fill(**{'foo': 'bar'})
-        with self.assertRaises(NoSettableError):
-            user.fill(**{'older_than': True})
-
     async def test_save(self):
         """Test for ``save`` function."""
         logger.info('Testing "save" function...')
         user = User(username='Test28', name='Test User', age=20)
+        start = utcnow()
         await user.save()
-        now = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M')
+        end = utcnow()
         self.assertIsNotNone(user.id)
-        self.assertEqual(now, user.created_at.strftime('%Y-%m-%d %H:%M'))
-        self.assertEqual(now, user.updated_at.strftime('%Y-%m-%d %H:%M'))
+        self.assertTrue(start <= user.created_at <= end)
+        self.assertTrue(start <= user.updated_at <= end)
         with self.assertRaises(IntegrityError):
             test_user = User(username='Test28', name='Test User', age=20)
             await test_user.save()
@@ -126,15 +94,21 @@ class TestActiveRecordMixin(unittest.IsolatedAsyncioTestCase):
     async def test_update(self):
         """Test for ``update`` function."""
         logger.info('Testing "update" function...')
-        user = await User.get_or_fail(1)
-        self.assertEqual('Bob Williams', user.name)
-        await asyncio.sleep(1)
-        await user.update(name='Bob Doe')
+        past = utcnow() - timedelta(hours=1)
+        user = await User.insert(
+            username='Test321',
+            name='Test User',
+            age=20,
+            created_at=past,
+            updated_at=past,
+        )
+        await user.update(name='Test User Updated')
+        self.assertEqual(past, user.created_at)
         self.assertGreater(user.updated_at, user.created_at)
-        self.assertEqual('Bob Doe', user.name)
+        self.assertEqual('Test User Updated', user.name)
 
         # Undo changes
-        await user.update(name='Bob Williams')
+        await user.delete()
 
     async def test_delete(self):
         """Test for ``delete`` and ``remove`` functions."""
@@ -162,17 +136,18 @@ class TestActiveRecordMixin(unittest.IsolatedAsyncioTestCase):
     async def test_insert(self):
         """Test for ``insert`` and ``create`` functions."""
         logger.info('Testing "insert" and "create" functions...')
+        start = utcnow()
         user1 = await User.insert(username='Test98', name='Test User 1', age=20)
         user2 = await User.insert(username='Test95', name='Test User 2', age=20)
         user3 = await User.create(username='Test92', name='Test User 3', age=20)
-        now = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M')
+        end = utcnow()
         for user in [user1, user2, user3]:
             self.assertIsNotNone(user.id)
-            self.assertEqual(now, user.created_at.strftime('%Y-%m-%d %H:%M'))
-            self.assertEqual(now, user.updated_at.strftime('%Y-%m-%d %H:%M'))
+            self.assertTrue(start <= user.created_at <= end)
+            self.assertTrue(start <= user.updated_at <= end)
 
         # Undo changes
-        await User.delete_all([user1, user2, user3])
+        await User.destroy(user1.id, user2.id, user3.id)
 
     async def test_save_all(self):
         """Test for ``save_all``function."""
@@ -188,12 +163,13 @@ class TestActiveRecordMixin(unittest.IsolatedAsyncioTestCase):
         user_ids = [user.id for user in users]
         for uid in user_ids:
             self.assertIsNone(uid)
+        start = utcnow()
         await User.save_all(users)
-        now = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M')
+        end = utcnow()
         for user in users:
             self.assertIsNotNone(user.id)
-            self.assertEqual(now, user.created_at.strftime('%Y-%m-%d %H:%M'))
-            self.assertEqual(now, user.updated_at.strftime('%Y-%m-%d %H:%M'))
+            self.assertTrue(start <= user.created_at <= end)
+            self.assertTrue(start <= user.updated_at <= end)
         with self.assertRaises(IntegrityError):
             test_users = [
                 User(username='Test100', name='Test User 1', age=20),
@@ -202,7 +178,7 @@ class TestActiveRecordMixin(unittest.IsolatedAsyncioTestCase):
             await User.save_all(test_users)
 
         # Undo changes
-        await User.delete_all(users)
+        await User.destroy(*(user.id for user in users))
 
     async def test_insert_all(self):
         """Test for ``insert_all``function."""
@@ -224,15 +200,16 @@ class TestActiveRecordMixin(unittest.IsolatedAsyncioTestCase):
         user_ids = [user.id for user in users]
         for uid in user_ids:
             self.assertIsNone(uid)
+        start = utcnow()
         await User.insert_all(users)
-        now = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M')
+        end = utcnow()
         for user in users:
             self.assertIsNotNone(user.id)
-            self.assertEqual(now, user.created_at.strftime('%Y-%m-%d %H:%M'))
-            self.assertEqual(now, user.updated_at.strftime('%Y-%m-%d %H:%M'))
+            self.assertTrue(start <= user.created_at <= end)
+            self.assertTrue(start <= user.updated_at <= end)
 
         # Undo changes
-        await User.delete_all(users)
+        await User.destroy(*(user.id for user in users))
 
     async def test_update_all(self):
         """Test for ``update_all`` function."""
@@ -247,17 +224,19 @@ class TestActiveRecordMixin(unittest.IsolatedAsyncioTestCase):
             User(username='Test711', name='Test User 7', age=40),
             User(username='Test811', name='Test User 8', age=40),
         ]
+        past = utcnow() - timedelta(hours=1)
+        for user in users:
+            user.created_at = user.updated_at = past
         await User.insert_all(users)
         for user in users:
             user.name = user.name.replace('Test User', 'Test User Updated')
-        await asyncio.sleep(1)
         await User.update_all(users, refresh=True)
         for user in users:
             self.assertIn('Updated', user.name)
             self.assertGreater(user.updated_at, user.created_at)
 
         # Undo changes
-        await User.delete_all(users)
+        await User.destroy(*(user.id for user in users))
 
     async def test_delete_all(self):
         """Test for ``delete_all`` function."""
@@ -273,9 +252,9 @@ class TestActiveRecordMixin(unittest.IsolatedAsyncioTestCase):
             User(username='DeleteTest821', name='Test User 8', age=40),
         ]
         await User.insert_all(users)
-        users = await User.find(username__startswith='DeleteTest').all()
         await User.delete_all(users)
         users = await User.find(username__startswith='DeleteTest').all()
+        self.assertEqual([], users)
         with self.assertRaises(InvalidRequestError):
             users = [
                 User(username='Unknown121', name='Unknown User 1', age=20),
@@ -286,16 +265,27 @@ class TestActiveRecordMixin(unittest.IsolatedAsyncioTestCase):
     async def test_destroy(self):
         """Test for ``destroy`` function."""
         logger.info('Testing "destroy" function...')
-        user1 = await User.get_or_fail(30)
-        user2 = await User.get_or_fail(31)
-        user3 = await User.get_or_fail(32)
-        await User.destroy(user1.id, user2.id, user3.id)
-        user1 = await User.get(30)
-        user2 = await User.get(31)
-        user3 = await User.get(32)
-        self.assertIsNone(user1)
-        self.assertIsNone(user2)
-        self.assertIsNone(user3)
+        ids = [30, 31, 32]
+        users = await User.where(id__in=ids).all()
+        self.assertEqual(3, len(users))
+        selects: list[str] = []
+
+        def count_select(_conn, _cursor, statement, *_):
+            if statement.lstrip().upper().startswith('SELECT'):
+                selects.append(statement)
+
+        engine = self.conn.async_engine.sync_engine
+        event.listen(engine, 'after_cursor_execute', count_select)
+        try:
+            await User.destroy(*ids)
+        finally:
+            event.remove(engine, 'after_cursor_execute', count_select)
+
+        # one query for the users and one per collection,
+        # not one per collection and user
+        self.assertEqual(3, len(selects))
+        users = await User.where(id__in=ids).all()
+        self.assertEqual([], users)
         user = None
         post = None
         with self.assertRaises(IntegrityError):
@@ -318,6 +308,24 @@ class TestActiveRecordMixin(unittest.IsolatedAsyncioTestCase):
             ]
         )
 
+    async def test_destroy_with_dynamic_relationship(self):
+        """Test for ``destroy`` function with a dynamic relationship."""
+        logger.info('Testing "destroy" function with a dynamic relationship...')
+        category = await Category.insert(name='Books')
+        items = [
+            Item(name='Novel', category_id=category.id),
+            Item(name='Essay', category_id=category.id),
+        ]
+        await Item.insert_all(items)
+        await Category.destroy(category.id)
+        self.assertIsNone(await Category.get(category.id))
+        item_ids = [item.id for item in items]
+        items = await Item.where(id__in=item_ids).all()
+        self.assertEqual([None, None], [item.category_id for item in items])
+
+        # Undo changes
+        await Item.destroy(*item_ids)
+
     async def test_get(self):
         """Test for ``get`` function."""
         logger.info('Testing "get" function...')
@@ -363,19 +371,11 @@ class TestActiveRecordMixin(unittest.IsolatedAsyncioTestCase):
     async def test_get_or_fail(self):
         """Test for ``get_or_fail`` function."""
         logger.info('Testing "get_or_fail" function...')
-        user = await User.get_or_fail(2)
-        self.assertEqual('Bill65', user.username)
         with self.assertRaises(NoResultFound):
             await User.get_or_fail(0)
 
-        user = await User.get_or_fail(2, join=[User.posts, (User.comments, True)])
-        self.assertEqual(2, user.posts[0].id)
-        self.assertEqual(3, user.comments[0].id)
-        self.assertEqual(4, user.comments[1].id)
-        user = await User.get_or_fail(2, subquery=[User.posts, (User.comments, True)])
-        self.assertEqual(2, user.posts[0].id)
-        self.assertEqual(3, user.comments[0].id)
-        self.assertEqual(4, user.comments[1].id)
+        # ``get_or_fail`` delegates to ``get``, whose loader options
+        # are covered by ``test_get``, so a single eager fetch is enough
         user = await User.get_or_fail(
             pk=2,
             schema={
@@ -383,8 +383,10 @@ class TestActiveRecordMixin(unittest.IsolatedAsyncioTestCase):
                 User.comments: (SUBQUERY, {Comment.post: SELECT_IN}),
             },
         )
+        self.assertEqual('Bill65', user.username)
         self.assertEqual(2, user.posts[0].id)
         self.assertEqual(3, user.comments[0].id)
+        self.assertEqual(4, user.comments[1].id)
         self.assertEqual(2, user.comments[0].post.id)
 
     async def test_scalars(self):
@@ -406,33 +408,33 @@ class TestActiveRecordMixin(unittest.IsolatedAsyncioTestCase):
         if user:
             self.assertEqual('Bob Williams', user[0].name)
 
-    async def test_one(self):
-        """Test for ``one`` function."""
-        logger.info('Testing "one" function...')
-        with self.assertRaises(MultipleResultsFound):
-            await User.one()
-        user = await User.find(username='Joe156').one()
-        self.assertEqual('Joe Smith', user.name)
-        user = await User.find(username='Joe156').one(scalar=False)
-        self.assertIsNotNone(user)
-        if user:
-            self.assertEqual('Joe Smith', user[0].name)
-
-    async def test_one_or_none(self):
-        """Test for ``one_or_none`` function."""
-        logger.info('Testing "one_or_none" function...')
-        with self.assertRaises(MultipleResultsFound):
-            await User.one_or_none()
-        user = await User.find(username='Joe156').one_or_none()
-        self.assertIsNotNone(user)
-        if user:
-            self.assertEqual('Joe Smith', user.name)
-        user = await User.find(username='Unknown').one_or_none()
-        self.assertIsNone(user)
-        user = await User.find(username='Joe156').one_or_none(scalar=False)
-        self.assertIsNotNone(user)
-        if user:
-            self.assertEqual('Joe Smith', user[0].name)
+    async def test_one_family(self):
+        """Test for ``one``, ``one_or_none``, ``unique_one`` and
+        ``unique_one_or_none`` functions.
+        """
+        logger.info('Testing "one" family of functions...')
+        query = User.find(username='Joe156')
+        for method_name, or_none in [
+            ('one', False),
+            ('one_or_none', True),
+            ('unique_one', False),
+            ('unique_one_or_none', True),
+        ]:
+            with self.subTest(method=method_name):
+                with self.assertRaises(MultipleResultsFound):
+                    await getattr(User, method_name)()
+                user = await getattr(query, method_name)()
+                self.assertIsNotNone(user)
+                if user:
+                    self.assertEqual('Joe Smith', user.name)
+                user = await getattr(query, method_name)(scalar=False)
+                self.assertIsNotNone(user)
+                if user:
+                    self.assertEqual('Joe Smith', user[0].name)
+                if or_none:
+                    unknown = User.find(username='Unknown')
+                    user = await getattr(unknown, method_name)()
+                    self.assertIsNone(user)
 
     async def test_all(self):
         """Test for ``all`` function."""
@@ -443,6 +445,15 @@ class TestActiveRecordMixin(unittest.IsolatedAsyncioTestCase):
         users = await User.all(scalars=False)
         self.assertEqual('Mike Turner', users[10][0].name)
 
+    async def test_stream(self):
+        """Test for ``stream`` function."""
+        logger.info('Testing "stream" function...')
+        users = [user async for user in User.stream(batch_size=5)]
+        self.assertEqual(34, len(users))
+        self.assertEqual('Mike Turner', users[10].name)
+        users = [user async for user in User.where(age__lt=20).stream()]
+        self.assertTrue(all(user.age < 20 for user in users))
+
     async def test_count(self):
         """Test for ``count`` function."""
         logger.info('Testing "count" function...')
@@ -471,34 +482,6 @@ class TestActiveRecordMixin(unittest.IsolatedAsyncioTestCase):
         if user:
             self.assertEqual('Bob Williams', user[0].name)
 
-    async def test_unique_one(self):
-        """Test for ``unique_one`` function."""
-        logger.info('Testing "unique_one" function...')
-        with self.assertRaises(MultipleResultsFound):
-            await User.unique_one()
-        user = await User.find(username='Joe156').unique_one()
-        self.assertEqual('Joe Smith', user.name)
-        user = await User.find(username='Joe156').unique_one(scalar=False)
-        self.assertIsNotNone(user)
-        if user:
-            self.assertEqual('Joe Smith', user[0].name)
-
-    async def test_unique_one_or_none(self):
-        """Test for ``unique_one_or_none`` function."""
-        logger.info('Testing "unique_one_or_none" function...')
-        with self.assertRaises(MultipleResultsFound):
-            await User.unique_one_or_none()
-        user = await User.find(username='Joe156').unique_one_or_none()
-        self.assertIsNotNone(user)
-        if user:
-            self.assertEqual('Joe Smith', user.name)
-        user = await User.find(username='Unknown').unique_one_or_none()
-        self.assertIsNone(user)
-        user = await User.find(username='Joe156').unique_one_or_none(scalar=False)
-        self.assertIsNotNone(user)
-        if user:
-            self.assertEqual('Joe Smith', user[0].name)
-
     async def test_unique_all(self):
         """Test for ``unique_all`` function."""
         logger.info('Testing "unique_all" function...')
@@ -668,12 +651,29 @@ class TestActiveRecordMixin(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(NegativeIntegerError):
             await User.limit(-1).where(username__like='Ji%').all()
 
+    async def test_paginate(self):
+        """Test for ``paginate`` function."""
+        logger.info('Testing "paginate" function...')
+        users = await User.paginate(1, 1).where(username__like='Ji%').all()
+        self.assertEqual(1, len(users))
+        users = await User.paginate(offset=1).where(username__like='Ji%').all()
+        self.assertEqual(2, len(users))
+        users = await User.paginate(limit=2).where(username__like='Ji%').all()
+        self.assertEqual(2, len(users))
+        query = User.paginate().query
+        self.assertIsNone(query._offset_clause)
+        self.assertIsNone(query._limit_clause)
+        with self.assertRaises(NegativeIntegerError):
+            User.paginate(offset=-1)
+        with self.assertRaises(NegativeIntegerError):
+            User.paginate(limit=-1)
+
     async def test_join(self):
         """Test for ``join`` function."""
         logger.info('Testing "join" function...')
         users = await User.join(User.posts, (User.comments, True)).unique_all()
         USERS_THAT_HAVE_COMMENTS = [1, 2, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14]
-        self.assertEqual(USERS_THAT_HAVE_COMMENTS, [user.id for user in users])
+        self.assertCountEqual(USERS_THAT_HAVE_COMMENTS, [user.id for user in users])
         self.assertEqual(
             'Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
             users[0].comments[0].body,
@@ -684,11 +684,13 @@ class TestActiveRecordMixin(unittest.IsolatedAsyncioTestCase):
             await User.join(Post.comments).all()
         with self.assertRaises(RelationError):
             await User.join((Post.comments, True)).all()
+        with self.assertRaises(RelationError):
+            await User.join(User.name).all()
 
     async def test_with_subquery(self):
         """Test for ``with_subquery`` function."""
         logger.info('Testing "with_subquery" function...')
-        users_count = len(await User.all())
+        users_count = await User.count()
         users = await User.with_subquery(User.posts, (User.comments, True)).all()
         self.assertEqual(users_count, len(users), 'message')
         self.assertEqual(
@@ -701,6 +703,23 @@ class TestActiveRecordMixin(unittest.IsolatedAsyncioTestCase):
             await User.with_subquery(Post.comments).all()
         with self.assertRaises(RelationError):
             await User.with_subquery((Post.comments, True)).all()
+        with self.assertRaises(RelationError):
+            await User.with_subquery(User.name).all()
+
+    async def test_prefetch(self):
+        """Test for ``prefetch`` function."""
+        logger.info('Testing "prefetch" function...')
+        users = await User.prefetch(User.posts, User.comments).limit(5).all()
+        self.assertEqual(5, len(users))
+        self.assertEqual(
+            'Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
+            users[0].comments[0].body,
+        )
+        self.assertEqual('Lorem ipsum', users[0].posts[0].title)
+        with self.assertRaises(RelationError):
+            await User.prefetch(Post.comments).all()
+        with self.assertRaises(RelationError):
+            await User.prefetch(User.name).all()
 
     async def test_with_schema(self):
         """Test for ``with_schema`` function."""
@@ -739,3 +758,45 @@ class TestActiveRecordMixin(unittest.IsolatedAsyncioTestCase):
         )
         self.assertEqual('Lorem ipsum', users[0].posts[0].title)
         self.assertEqual('Lorem ipsum', users[0].comments[0].post.title)
+
+    def test_getitem(self):
+        """Test for ``__getitem__`` method."""
+        logger.info('Testing "__getitem__" method...')
+        user = User(username='Test1000', name='Test User', age=20)
+        self.assertEqual('Test1000', user['username'])
+        self.assertEqual('Test User', user['name'])
+        self.assertEqual(20, user['age'])
+        with self.assertRaises(ModelAttributeError):
+            user['foo']
+
+    def test_setitem(self):
+        """Test for ``__setitem__`` method."""
+        logger.info('Testing "__setitem__" method...')
+        user = User(username='Test1000', name='Test User', age=20)
+        user['name'] = 'Test User 2'
+        self.assertEqual('Test User 2', user.name)
+        user['age'] = 30
+        self.assertEqual(30, user.age)
+        with self.assertRaises(ModelAttributeError):
+            user['foo'] = 'bar'
+        with self.assertRaises(NoSettableError):
+            user['older_than'] = True
+
+    def test_get_primary_key_name(self):
+        """Test for ``_get_primary_key_name`` function."""
+        logger.info('Testing "_get_primary_key_name" function...')
+        with self.assertRaises(CompositePrimaryKeyError):
+            Sell.get_primary_key_name()
+
+    def test_fill(self):
+        """Test for ``fill`` function."""
+        logger.info('Testing "fill" function...')
+        user = User(username='Bob28', name='Bob', age=30)
+        user.fill(**{'name': 'Bob Williams', 'age': 32})
+        self.assertEqual('Bob28', user.username)
+        self.assertEqual('Bob Williams', user.name)
+        self.assertEqual(32, user.age)
+        with self.assertRaises(ModelAttributeError):
+            user.fill(**{'foo': 'bar'})
+        with self.assertRaises(NoSettableError):
+            user.fill(**{'older_than': True})
@@ -1,68 +1,110 @@
-import asyncio
-import unittest
+from enum import Enum
+
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.sql import func
 
 from sqlactive.async_query import AsyncQuery
 from sqlactive.conn import DBConnection
 
+from ._asynccase import AsyncTestCase
 from ._logger import logger
 from ._models import BaseModel, Post, User
 from ._seed import Seed
 
+EXPECTED_USER_COUNT = 34
+EXPECTED_JI_USER_COUNT = 3
+EXPECTED_JOE_NAME = 'Joe Smith'
+
 
-class TestAsyncQuery(unittest.IsolatedAsyncioTestCase):
+class TestAsyncQuery(AsyncTestCase):
     """Tests for ``sqlactive.async_query.AsyncQuery``."""
 
     DB_URL = 'sqlite+aiosqlite://'
 
     @classmethod
     def setUpClass(cls):
+        super().setUpClass()
         logger.info('***** AsyncQuery tests *****')
         logger.info('Creating DB connection...')
-        cls.conn = DBConnection(cls.DB_URL, echo=False)
+        cls.conn = DBConnection(cls.DB_URL, echo=False, poolclass=StaticPool)
+        cls.addClassCleanup(cls.close_connection)
         seed = Seed(cls.conn, BaseModel)
-        asyncio.run(seed.run())
+        cls.loop.run_until_complete(seed.run())
 
     @classmethod
-    def tearDownClass(cls):
-        if hasattr(cls, 'conn'):
-            logger.info('Closing DB connection...')
-            asyncio.run(cls.conn.close())
+    def close_connection(cls):
+        logger.info('Closing DB connection...')
+        cls.loop.run_until_complete(cls.conn.close())
 
     async def test_init(self):
         """Test for ``fill`` function."""
-        logger.info('Testing constructor...')
+        logger.debug('Testing constructor...')
         async_query = AsyncQuery(User.query)
         users = await async_query.all()
-        self.assertEqual(34, len(users))
+        self.assertEqual(EXPECTED_USER_COUNT, len(users))
 
     async def test_query(self):
         """Test for ``fill`` function."""
-        logger.info('Testing "query" property...')
+        logger.debug('Testing "query" property...')
         async_query = User.get_async_query()
         async_query.query = async_query.query.limit(1)
         users = (await async_query.execute()).scalars().all()
         self.assertEqual(1, len(users))
         self.assertEqual('Bob Williams', users[0].name)
 
+    async def test_gather(self):
+        """Test for ``gather`` function."""
+        logger.debug('Testing "gather" function...')
+        users_result, posts_result = await AsyncQuery.gather(
+            User.get_async_query().filter(username__like='Ji%'),
+            Post.get_async_query().filter(rating=5),
+        )
+        self.assertEqual(EXPECTED_JI_USER_COUNT, len(users_result.scalars().all()))
+        self.assertEqual(4, len(posts_result.scalars().all()))
+        self.assertEqual([], await AsyncQuery.gather())
+
+    async def test_clone(self):
+        """Test for ``clone`` function."""
+        logger.debug('Testing "clone" function...')
+        async_query = User.get_async_query().filter(username__like='Ji%')
+        query = async_query.query
+        clone = async_query.clone()
+        self.assertIsNot(async_query, clone)
+        self.assertIs(query, clone.query)
+        clone.limit(1)
+        self.assertIs(query, async_query.query)
+        self.assertEqual(1, len(await clone.all()))
+        self.assertEqual(EXPECTED_JI_USER_COUNT, len(await async_query.all()))
+
     async def test_str_and_repr(self):
         """Test for ``__str__`` and ``__repr__`` functions."""
-        logger.info('Testing "__str__" and "__repr__" functions...')
+        logger.debug('Testing "__str__" and "__repr__" functions...')
         async_query = User.get_async_query()
         self.assertEqual(repr(async_query), str(async_query.query))
         self.assertEqual(str(async_query), str(async_query.query))
+        async_query.filter(username='Joe156')
+        self.assertEqual(str(async_query), str(async_query.query))
+        self.assertIn('WHERE', str(async_query))
+
+    async def test_empty_eager_loading(self):
+        """Test for eager loading functions without paths."""
+        logger.debug('Testing eager loading functions without paths...')
+        async_query = User.get_async_query()
+        query = async_query.query
+        async_query.join().with_subquery().prefetch().with_schema({}).options()
+        self.assertIs(query, async_query.query)
 
     async def test_filter_and_find(self):
         """Test for ``filter`` and ``find`` functions."""
-        logger.info('Testing "filter" and "find" functions...')
-        async_query = User.get_async_query()
-        user = await async_query.filter(username='Joe156').one()
-        self.assertEqual('Joe Smith', user.name)
-        user = await async_query.find(username='Joe156').one()
-        self.assertEqual('Joe Smith', user.name)
+        logger.debug('Testing "filter" and "find" functions...')
+        user = await User.get_async_query().filter(username='Joe156').one()
+        self.assertEqual(EXPECTED_JOE_NAME, user.name)
+        user = await User.get_async_query().find(username='Joe156').one()
+        self.assertEqual(EXPECTED_JOE_NAME, user.name)
 
     async def test_sort(self):
         """Test for ``sort`` function."""
-        logger.info('Testing "sort" function...')
+        logger.debug('Testing "sort" function...')
         async_query = User.get_async_query()
         users = await async_query.filter(username__like='Ji%').all()
         self.assertEqual('Jim32', users[0].username)
@@ -72,20 +114,42 @@ class TestAsyncQuery(unittest.IsolatedAsyncioTestCase):
         posts = await async_query.sort('-rating', 'user___name').all()
         self.assertEqual(24, len(posts))
 
+    async def test_str_enum_attrs(self):
+        """Test ``sort`` and ``group_by`` with ``str`` subclass attrs."""
+        logger.debug('Testing "sort" and "group_by" with str enums...')
+
+        class UserAttr(str, Enum):
+            USERNAME = 'username'
+            AGE = 'age'
+
+        users = (
+            await User.get_async_query()
+            .filter(username__like='Ji%')
+            .sort(UserAttr.USERNAME)
+            .all()
+        )
+        self.assertEqual('Jill874', users[0].username)
+        rows = (
+            await User.get_async_query()
+            .group_by(UserAttr.AGE, select_columns=[User.age, func.count()])
+            .all(scalars=False)
+        )
+        self.assertEqual((19, 1), tuple(rows[0]))
+
     async def test_skip(self):
         """Test for ``skip`` function."""
-        logger.info('Testing "skip" function...')
-        async_query = User.get_async_query()
-        users = await async_query.skip(1).filter(username__like='Ji%').all()
+        logger.debug('Testing "skip" function...')
+        async_query = User.get_async_query().filter(username__like='Ji%')
+        users = await async_query.clone().skip(1).all()
         self.assertEqual(2, len(users))
-        users = await async_query.skip(2).filter(username__like='Ji%').all()
+        users = await async_query.clone().skip(2).all()
         self.assertEqual(1, len(users))
 
     async def test_take_and_top(self):
         """Test for ``take`` and ``top`` functions."""
-        logger.info('Test for "take" and "top" functions...')
-        async_query = User.get_async_query()
-        users = await async_query.take(2).filter(username__like='Ji%').all()
+        logger.debug('Test for "take" and "top" functions...')
+        async_query = User.get_async_query().filter(username__like='Ji%')
+        users = await async_query.clone().take(2).all()
         self.assertEqual(2, len(users))
-        users = await async_query.top(1).filter(username__like='Ji%').all()
+        users = await async_query.clone().top(1).all()
         self.assertEqual(1, len(users))
@@ -21,6 +21,7 @@ class TestDBConnection(unittest.IsolatedAsyncioTestCase):
         """Test for ``init_db`` function."""
         logger.info('Testing constructor...')
         conn = DBConnection(self.DB_URL, echo=False)
+        self.assertTrue(conn.async_engine.dialect.supports_statement_cache)
 
         logger.info('Testing "init_db" function...')
         await conn.init_db()
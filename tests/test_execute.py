@@ -1,43 +1,59 @@
-import asyncio
-import unittest
-
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.sql import func, select
 
-from sqlactive.base_model import ActiveRecordBaseModel
-from sqlactive.conn import DBConnection, execute
-from sqlactive.exceptions import NoSessionError
+from sqlactive.conn import DBConnection, execute, execute_many
 
+from ._asynccase import AsyncTestCase
 from ._logger import logger
 from ._models import BaseModel, User
 from ._seed import Seed
 
+AGE_COUNT_QUERY = select(User.age, func.count(User.id)).group_by(User.age)
+EXPECTED_AGE_COUNTS = ((19, 1), (24, 1), (25, 2), (26, 2), (27, 3))
+
 
-class TestExecuteFunction(unittest.IsolatedAsyncioTestCase):
+class TestExecuteFunction(AsyncTestCase):
     """Tests for ``sqlactive.conn.execute`` function."""
 
     DB_URL = 'sqlite+aiosqlite://'
 
     @classmethod
     def setUpClass(cls):
+        super().setUpClass()
         logger.info('***** "execute" tests *****')
         logger.info('Creating DB connection...')
-        cls.conn = DBConnection(cls.DB_URL, echo=False)
+        cls.conn = DBConnection(cls.DB_URL, echo=False, poolclass=StaticPool)
+        cls.addClassCleanup(cls.close_connection)
         seed = Seed(cls.conn, BaseModel)
-        asyncio.run(seed.run())
+        cls.loop.run_until_complete(seed.run())
 
     @classmethod
-    def tearDownClass(cls):
-        if hasattr(cls, 'conn'):
-            logger.info('Closing DB connection...')
-            asyncio.run(cls.conn.close())
+    def close_connection(cls):
+        logger.info('Closing DB connection...')
+        cls.loop.run_until_complete(cls.conn.close())
 
     async def test_execute(self):
         """Test for ``sqlactive.conn.execute`` function."""
-        logger.info('Testing "execute" function...')
-        query = select(User.age, func.count(User.id)).group_by(User.age)
-        result = await execute(self.conn.async_scoped_session, query)
-        self.assertEqual((19, 1), next(result))
-        self.assertEqual((24, 1), next(result))
-        self.assertEqual((25, 2), next(result))
-        self.assertEqual((26, 2), next(result))
-        self.assertEqual((27, 3), next(result))
+        logger.debug('Testing "execute" function...')
+        result = await execute(self.conn.async_scoped_session, AGE_COUNT_QUERY)
+        rows = result.all()
+        self.assertEqual(EXPECTED_AGE_COUNTS, tuple(rows[: len(EXPECTED_AGE_COUNTS)]))
+
+        async with self.conn.async_scoped_session() as session:
+            result = await execute(session, AGE_COUNT_QUERY)
+            self.assertEqual((19, 1), next(result))
+            self.assertTrue(session.is_active)
+
+    async def test_execute_many(self):
+        """Test for ``sqlactive.conn.execute_many`` function."""
+        logger.debug('Testing "execute_many" function...')
+        names_query = select(User.name).where(User.age == 25)
+        ages, names = await execute_many(
+            self.conn.async_scoped_session, AGE_COUNT_QUERY, names_query
+        )
+        rows = ages.all()
+        self.assertEqual(EXPECTED_AGE_COUNTS, tuple(rows[: len(EXPECTED_AGE_COUNTS)]))
+        self.assertEqual(2, len(names.scalars().all()))
+        self.assertEqual(
+            [], await execute_many(self.conn.async_scoped_session)
+        )
@@ -1,6 +1,9 @@
 import asyncio
 import unittest
 
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, configure_mappers, mapped_column, relationship
+
 from sqlactive.conn import DBConnection
 from sqlactive.exceptions import CompositePrimaryKeyError, RelationError
 
@@ -45,6 +48,8 @@ class TestInspectionMixin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual('id=1, product_id=1', sell.id_str)
         unknown_sell = Sell(id=1, product_id=1)
         self.assertEqual('id=1, product_id=1', unknown_sell.id_str)
+        new_sell = Sell(product_id=1)
+        self.assertEqual('id=None, product_id=1', new_sell.id_str)
 
     def test_columns(self):
         """Test for ``columns`` classproperty."""
@@ -85,6 +90,7 @@ class TestInspectionMixin(unittest.IsolatedAsyncioTestCase):
         """Test for ``hybrid_methods`` classproperty."""
         logger.info('Testing "hybrid_methods" classproperty...')
         self.assertCountEqual(['older_than'], User.hybrid_methods)
+        self.assertEqual(frozenset(['older_than']), User.hybrid_methods_set)
         self.assertTrue(User(age=35).older_than(User(age=30)))
         self.assertFalse(User(age=20).older_than(User(age=30)))
 
@@ -145,6 +151,60 @@ class TestInspectionMixin(unittest.IsolatedAsyncioTestCase):
         """Test for ``searchable_attributes`` classproperty."""
         logger.info('Testing "searchable_attributes" classproperty...')
         self.assertCountEqual(['username', 'name'], User.searchable_attributes)
+        self.assertEqual(
+            frozenset(User.searchable_attributes), User.searchable_attributes_set
+        )
+
+    def test_inspection_cache(self):
+        """Test for cached classproperties."""
+        logger.info('Testing cached classproperties...')
+        columns = User._columns
+        self.assertIs(columns, User._columns)
+        self.assertIsNot(columns, Post._columns)
+        User._invalidate_inspection_cache()
+        self.assertIsNot(columns, User._columns)
+        self.assertEqual(columns, User._columns)
+
+        # public properties return copies of the cached values
+        columns = User.columns
+        self.assertIsNot(columns, User.columns)
+        columns.append('foo')
+        self.assertNotIn('foo', User.columns)
+        User.relations.clear()
+        self.assertEqual(['posts', 'comments'], User.relations)
+        User.hybrid_methods_full.clear()
+        self.assertIn('older_than', User.hybrid_methods_full)
+        User.filterable_attributes.remove('id')
+        self.assertIn('id', User.filterable_attributes)
+        for name in ('filterable', 'sortable', 'settable'):
+            cached = getattr(User, f'_{name}_attributes')
+            self.assertIs(cached, getattr(User, f'_{name}_attributes'))
+            self.assertEqual(list(cached), getattr(User, f'{name}_attributes'))
+
+    def test_inspection_cache_after_configure(self):
+        """Test that cached classproperties see later backrefs."""
+        logger.info('Testing cached classproperties after configure...')
+
+        class LateParent(BaseModel):
+            __tablename__ = 'late_parents'
+            id: Mapped[int] = mapped_column(primary_key=True)
+
+        configure_mappers()
+        self.assertEqual([], LateParent.relations)
+
+        class LateChild(BaseModel):
+            __tablename__ = 'late_children'
+            id: Mapped[int] = mapped_column(primary_key=True)
+            name: Mapped[str] = mapped_column()
+            parent_id: Mapped[int] = mapped_column(ForeignKey('late_parents.id'))
+            parent: Mapped[LateParent] = relationship(backref='children')
+
+        configure_mappers()
+        self.assertEqual(['children'], LateParent.relations)
+        self.assertEqual(frozenset(['children']), LateParent.relations_set)
+        self.assertIs(LateChild, LateParent.get_class_of_relation('children'))
+        query = LateParent.where(children___id=1).query
+        self.assertIn('late_children', str(query))
 
     def test_get_class_of_relation(self):
         """Test for ``get_class_of_relation`` function."""
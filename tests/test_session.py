@@ -15,3 +15,19 @@ class TestSessionMixin(unittest.IsolatedAsyncioTestCase):
         """Test for ``NoSessionError`` exception."""
         with self.assertRaises(NoSessionError):
             TestModel.AsyncSession
+
+    async def test_set_session(self):
+        """Test for ``set_session`` function."""
+
+        class ChildModel(TestModel):
+            pass
+
+        session = object()
+        ChildModel.set_session(session)
+        self.assertIs(session, ChildModel._session)
+        self.assertIs(session, ChildModel.AsyncSession)
+        with self.assertRaises(NoSessionError):
+            TestModel.AsyncSession
+        ChildModel._session = None
+        with self.assertRaises(NoSessionError):
+            ChildModel.AsyncSession
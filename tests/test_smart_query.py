@@ -1,52 +1,81 @@
-import asyncio
-import unittest
-from collections import OrderedDict
+from collections.abc import Callable
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import func
+from sqlalchemy import Row, case, event, func, not_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased, joinedload, selectinload, subqueryload
-from sqlalchemy.sql import asc, desc
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.sql import ColumnElement, asc, desc
 from sqlalchemy.sql.operators import and_, or_
 
 from sqlactive import JOINED, SELECT_IN, SUBQUERY
-from sqlactive.conn import DBConnection
+from sqlactive.conn import DBConnection, execute
 from sqlactive.exceptions import (
     NoColumnOrHybridPropertyError,
     NoFilterableError,
+    NoSearchableError,
     NoSortableError,
     OperatorError,
     RelationError,
 )
 from sqlactive.smart_query import SmartQueryMixin
 
+from ._asynccase import AsyncTestCase
 from ._logger import logger
 from ._models import BaseModel, Comment, Post, User
 from ._seed import Seed
+from ._sqlite import set_pragmas
 
+POST_QUERY = Post.query
 
-class TestSmartQueryMixin(unittest.IsolatedAsyncioTestCase):
+
+class TestSmartQueryMixin(AsyncTestCase):
     """Tests for ``sqlactive.smart_query.SmartQueryMixin``."""
 
     DB_URL = 'sqlite+aiosqlite://'
 
     @classmethod
     def setUpClass(cls):
+        super().setUpClass()
         logger.info('***** SmartQueryMixin tests *****')
         logger.info('Creating DB connection...')
-        cls.conn = DBConnection(cls.DB_URL, echo=False)
+        cls.conn = DBConnection(cls.DB_URL, echo=False, poolclass=StaticPool)
+        cls.addClassCleanup(cls.close_connection)
+        event.listen(cls.conn.async_engine.sync_engine, 'connect', set_pragmas)
         seed = Seed(cls.conn, BaseModel)
-        asyncio.run(seed.run())
+        cls.loop.run_until_complete(seed.run())
 
     @classmethod
-    def tearDownClass(cls):
-        if hasattr(cls, 'conn'):
-            logger.info('Closing DB connection...')
-            asyncio.run(cls.conn.close())
+    def close_connection(cls):
+        logger.info('Closing DB connection...')
+        cls.loop.run_until_complete(cls.conn.close())
+
+    async def assertNoCounterexamples(
+        self,
+        session: AsyncSession,
+        model: type[BaseModel],
+        filters: dict[str, object],
+        expected: ColumnElement[bool],
+    ):
+        """Assert that no row matched by ``filters`` violates ``expected``.
+
+        Counts the counterexamples in SQL instead of loading
+        the matched instances.
+        """
+        query = (
+            select(func.count())
+            .select_from(model)
+            .where(*model.filter_expr(**filters), not_(expected))
+        )
+        result = await execute(session, query)
+        self.assertEqual(0, result.scalar_one(), filters)
 
     async def test_operators(self):
         """Test for operators."""
         logger.info('Testing operators...')
         today = datetime.today()
+        year, month, day = today.year, today.month, today.day
         post_with_topic = Post(
             title='Lorem ipsum',
             body='Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
@@ -61,269 +90,141 @@ class TestSmartQueryMixin(unittest.IsolatedAsyncioTestCase):
             user_id=1,
         )
 
-        async with post_with_topic, post_without_topic:
-            self.assertTrue(
-                all(
-                    [
-                        post.topic is None
-                        for post in await Post.where(topic__isnull=True).all()
-                    ]
+        # Flush the temporary posts and roll them back afterwards
+        # instead of committing and deleting each one.
+        async with self.conn.async_sessionmaker() as session:
+            session.add_all([post_with_topic, post_without_topic])
+            await session.flush()
+            try:
+                await self.assertNoCounterexamples(
+                    session, Post, {'topic__isnull': True}, Post.topic.is_(None)
                 )
-            )
-            self.assertTrue(
-                all(
-                    [
-                        post.topic is not None
-                        for post in await Post.where(topic__isnull=False).all()
-                    ]
+                await self.assertNoCounterexamples(
+                    session, Post, {'topic__isnull': False}, Post.topic.is_not(None)
                 )
-            )
+            finally:
+                await session.rollback()
 
-        self.assertTrue(
-            all([user.age == 25 for user in await User.where(age__exact=25).all()])
-        )
-        self.assertTrue(
-            all([user.age == 25 for user in await User.where(age__eq=25).all()])
-        )
-        self.assertTrue(
-            all([user.age != 25 for user in await User.where(age__ne=25).all()])
-        )
-        self.assertTrue(
-            all([user.age > 25 for user in await User.where(age__gt=25).all()])
-        )
-        self.assertTrue(
-            all([user.age >= 25 for user in await User.where(age__ge=25).all()])
-        )
-        self.assertTrue(
-            all([user.age < 25 for user in await User.where(age__lt=25).all()])
-        )
-        self.assertTrue(
-            all([user.age <= 25 for user in await User.where(age__le=25).all()])
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.age == 20 or user.age == 30
-                    for user in await User.where(age__in=[20, 30]).all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.age != 20 and user.age != 30
-                    for user in await User.where(age__notin=[20, 30]).all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.age >= 20 and user.age <= 30
-                    for user in await User.where(age__between=[20, 30]).all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.username.startswith('Ji')
-                    for user in await User.where(username__like='Ji%').all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.username.startswith('Ji')
-                    for user in await User.where(username__ilike='ji%').all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.username.startswith('Ji')
-                    for user in await User.where(username__startswith='Ji').all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.username.startswith('Ji')
-                    for user in await User.where(username__istartswith='ji').all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.name.endswith('Anderson')
-                    for user in await User.where(name__endswith='Anderson').all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.name.endswith('Anderson')
-                    for user in await User.where(name__iendswith='anderson').all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    'wa' in user.name.lower()
-                    for user in await User.where(name__contains='Wa').all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.created_at.year == today.year
-                    for user in await User.where(created_at__year=today.year).all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.created_at.year != (today.year - 1)
-                    for user in await User.where(created_at__year_ne=today.year).all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.created_at.year > (today.year - 1)
-                    for user in await User.where(created_at__year_gt=today.year).all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.created_at.year >= (today.year - 1)
-                    for user in await User.where(created_at__year_ge=today.year).all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.created_at.year < (today.year + 1)
-                    for user in await User.where(created_at__year_lt=today.year).all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.created_at.year <= (today.year + 1)
-                    for user in await User.where(created_at__year_le=today.year).all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.created_at.month == today.month
-                    for user in await User.where(created_at__month=today.month).all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.created_at.month != (today.month - 1)
-                    for user in await User.where(created_at__month_ne=today.month).all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.created_at.month > (today.month - 1)
-                    for user in await User.where(created_at__month_gt=today.month).all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.created_at.month >= (today.month - 1)
-                    for user in await User.where(created_at__month_ge=today.month).all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.created_at.month < (today.month + 1)
-                    for user in await User.where(created_at__month_lt=today.month).all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.created_at.month <= (today.month + 1)
-                    for user in await User.where(created_at__month_le=today.month).all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.created_at.day == today.day
-                    for user in await User.where(created_at__day=today.day).all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.created_at.day != (today.day - 1)
-                    for user in await User.where(created_at__day_ne=today.day).all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.created_at.day > (today.day - 1)
-                    for user in await User.where(created_at__day_gt=today.day).all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.created_at.day >= (today.day - 1)
-                    for user in await User.where(created_at__day_ge=today.day).all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.created_at.day < (today.day + 1)
-                    for user in await User.where(created_at__day_lt=today.day).all()
-                ]
-            )
-        )
-        self.assertTrue(
-            all(
-                [
-                    user.created_at.day <= (today.day + 1)
-                    for user in await User.where(created_at__day_le=today.day).all()
-                ]
-            )
-        )
+        checks: list[tuple[dict[str, object], Callable[[Row[Any]], bool]]] = [
+            ({'age__exact': 25}, lambda user: user.age == 25),
+            ({'age__eq': 25}, lambda user: user.age == 25),
+            ({'age__ne': 25}, lambda user: user.age != 25),
+            ({'age__gt': 25}, lambda user: user.age > 25),
+            ({'age__ge': 25}, lambda user: user.age >= 25),
+            ({'age__lt': 25}, lambda user: user.age < 25),
+            ({'age__le': 25}, lambda user: user.age <= 25),
+            ({'age__in': [20, 30]}, lambda user: user.age in (20, 30)),
+            ({'age__notin': [20, 30]}, lambda user: user.age not in (20, 30)),
+            ({'age__between': [20, 30]}, lambda user: 20 <= user.age <= 30),
+            ({'username__like': 'Ji%'}, lambda user: user.username.startswith('Ji')),
+            ({'username__ilike': 'ji%'}, lambda user: user.username.startswith('Ji')),
+            (
+                {'username__startswith': 'Ji'},
+                lambda user: user.username.startswith('Ji'),
+            ),
+            (
+                {'username__istartswith': 'ji'},
+                lambda user: user.username.startswith('Ji'),
+            ),
+            (
+                {'name__endswith': 'Anderson'},
+                lambda user: user.name.endswith('Anderson'),
+            ),
+            (
+                {'name__iendswith': 'anderson'},
+                lambda user: user.name.endswith('Anderson'),
+            ),
+            ({'name__contains': 'Wa'}, lambda user: 'wa' in user.name.lower()),
+            (
+                {'created_at__year': year},
+                lambda user: user.created_at.year == year,
+            ),
+            (
+                {'created_at__year_ne': year},
+                lambda user: user.created_at.year != (year - 1),
+            ),
+            (
+                {'created_at__year_gt': year},
+                lambda user: user.created_at.year > (year - 1),
+            ),
+            (
+                {'created_at__year_ge': year},
+                lambda user: user.created_at.year >= (year - 1),
+            ),
+            (
+                {'created_at__year_lt': year},
+                lambda user: user.created_at.year < (year + 1),
+            ),
+            (
+                {'created_at__year_le': year},
+                lambda user: user.created_at.year <= (year + 1),
+            ),
+            (
+                {'created_at__month': month},
+                lambda user: user.created_at.month == month,
+            ),
+            (
+                {'created_at__month_ne': month},
+                lambda user: user.created_at.month != (month - 1),
+            ),
+            (
+                {'created_at__month_gt': month},
+                lambda user: user.created_at.month > (month - 1),
+            ),
+            (
+                {'created_at__month_ge': month},
+                lambda user: user.created_at.month >= (month - 1),
+            ),
+            (
+                {'created_at__month_lt': month},
+                lambda user: user.created_at.month < (month + 1),
+            ),
+            (
+                {'created_at__month_le': month},
+                lambda user: user.created_at.month <= (month + 1),
+            ),
+            (
+                {'created_at__day': day},
+                lambda user: user.created_at.day == day,
+            ),
+            (
+                {'created_at__day_ne': day},
+                lambda user: user.created_at.day != (day - 1),
+            ),
+            (
+                {'created_at__day_gt': day},
+                lambda user: user.created_at.day > (day - 1),
+            ),
+            (
+                {'created_at__day_ge': day},
+                lambda user: user.created_at.day >= (day - 1),
+            ),
+            (
+                {'created_at__day_lt': day},
+                lambda user: user.created_at.day < (day + 1),
+            ),
+            (
+                {'created_at__day_le': day},
+                lambda user: user.created_at.day <= (day + 1),
+            ),
+        ]
+
+        # Evaluate every filter as a flag column of a single query
+        # instead of running one query per operator. Only the checked
+        # columns are selected, so no ``User`` instances are built.
+        columns = (User.age, User.username, User.name, User.created_at)
+        flags = [
+            case((User.filter_expr(**filters)[0], True), else_=False)
+            for filters, _ in checks
+        ]
+        query = select(*columns, *flags)
+        rows = (await execute(self.conn.async_scoped_session, query)).all()
+        self.assertTrue(rows)
+        for user in rows:
+            matches = user[len(columns) :]
+            for (filters, predicate), matched in zip(checks, matches, strict=True):
+                if matched:
+                    self.assertTrue(predicate(user), filters)
 
     async def test_filter_expr(self):
         """Test for ``filter_expr`` function."""
@@ -361,6 +262,17 @@ class TestSmartQueryMixin(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(OperatorError):
             User.filter_expr(username__unknown='Ji%')
 
+    def test_filter_expr_cache_key(self):
+        """Test that filters with different values share a cache key."""
+        logger.info('Testing "filter_expr" cache key...')
+        query = User.where(age__ge=25, username__like='J%').query
+        other_query = User.where(age__ge=30, username__like='B%').query
+        self.assertEqual(query._generate_cache_key(), other_query._generate_cache_key())
+        other_query = User.where(age__le=30, username__like='B%').query
+        self.assertNotEqual(
+            query._generate_cache_key(), other_query._generate_cache_key()
+        )
+
     async def test_order_expr(self):
         """Test for ``order_expr`` function."""
         logger.info('Testing "order_expr" function...')
@@ -370,7 +282,7 @@ class TestSmartQueryMixin(unittest.IsolatedAsyncioTestCase):
         expected_users = [
             user.username for user in await User.sort(*expected_expressions).all()
         ]
-        self.assertCountEqual(expected_users, users)
+        self.assertEqual(expected_users, users)
         self.assertEqual('Bill65', users[0])
         self.assertEqual('John84', users[-1])
 
@@ -407,10 +319,24 @@ class TestSmartQueryMixin(unittest.IsolatedAsyncioTestCase):
             joinedload(User.posts),
             subqueryload(User.comments).options(selectinload(Comment.post)),
         ]
-        users = [
-            user.to_dict(nested=True)
-            for user in await User.options(*expressions).unique_all()
-        ]
+        statements: list[str] = []
+
+        def count_statement(_conn, _cursor, statement, *_):
+            statements.append(statement)
+
+        engine = self.conn.async_engine.sync_engine
+        event.listen(engine, 'after_cursor_execute', count_statement)
+        try:
+            users = [
+                user.to_dict(nested=True)
+                for user in await User.options(*expressions).unique_all()
+            ]
+        finally:
+            event.remove(engine, 'after_cursor_execute', count_statement)
+
+        # one statement per loader: the joined users and posts,
+        # the comments subquery and the comments' posts
+        self.assertEqual(3, len(statements))
         expected_users = [
             user.to_dict(nested=True)
             for user in await User.options(*expected_expressions).unique_all()
@@ -421,10 +347,31 @@ class TestSmartQueryMixin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual('Bob28', expected_users[0]['username'])
         self.assertEqual(4, expected_users[0]['posts'][0]['rating'])
 
+    def test_get_search_attrs(self):
+        """Test for ``_get_search_attrs`` function."""
+        logger.info('Testing "_get_search_attrs" function...')
+        attrs = SmartQueryMixin._get_search_attrs(User)
+        self.assertEqual(
+            [getattr(User, col).key for col in User.searchable_attributes],
+            [attr.key for attr in attrs],
+        )
+        self.assertIs(attrs, SmartQueryMixin._get_search_attrs(User))
+        attrs = SmartQueryMixin._get_search_attrs(User, ['name', User.username])
+        self.assertEqual(['name', 'username'], [attr.key for attr in attrs])
+        self.assertIs(
+            attrs, SmartQueryMixin._get_search_attrs(User, [User.name, 'username'])
+        )
+        with self.assertRaises(NoSearchableError):
+            SmartQueryMixin._get_search_attrs(User, ['age'])
+        User._invalidate_inspection_cache()
+        self.assertIsNot(
+            attrs, SmartQueryMixin._get_search_attrs(User, [User.name, 'username'])
+        )
+
     def test_make_aliases_from_attrs(self):
         """Test for ``_make_aliases_from_attrs`` function."""
         logger.info('Testing "_make_aliases_from_attrs" function...')
-        aliases = OrderedDict()
+        aliases = {}
         SmartQueryMixin._make_aliases_from_attrs(
             entity=Comment,
             entity_path='',
@@ -439,7 +386,7 @@ class TestSmartQueryMixin(unittest.IsolatedAsyncioTestCase):
             aliases=aliases,
         )
         self.assertTrue(type(aliases['post'][0]) is type(aliased(Post)))
-        self.assertTrue(aliases['post'][0].__mapper__.class_ == Post)
+        self.assertIs(Post, aliases['post'][0].__mapper__.class_)
         with self.assertRaises(RelationError):
             SmartQueryMixin._make_aliases_from_attrs(
                 entity=Comment,
@@ -451,18 +398,16 @@ class TestSmartQueryMixin(unittest.IsolatedAsyncioTestCase):
     def test_recurse_filters(self):
         """Test for ``_recurse_filters`` function."""
         logger.info('Testing "_recurse_filters" function...')
-        aliases = OrderedDict(
-            {
-                'user': (
-                    aliased(Comment.user.property.mapper.class_),
-                    Comment.user,
-                ),
-                'post': (
-                    aliased(Comment.post.property.mapper.class_),
-                    Comment.post,
-                ),
-            }
-        )
+        aliases = {
+            'user': (
+                aliased(Comment.user.property.mapper.class_),
+                Comment.user,
+            ),
+            'post': (
+                aliased(Comment.post.property.mapper.class_),
+                Comment.post,
+            ),
+        }
         filters = {
             or_: {
                 'post___rating__gt': 3,
@@ -498,14 +443,12 @@ class TestSmartQueryMixin(unittest.IsolatedAsyncioTestCase):
     def test_sort_query(self):
         """Test for ``_sort_query`` function."""
         logger.info('Testing "_sort_query" function...')
-        aliases = OrderedDict(
-            {
-                'user': (aliased(Post.user.property.mapper.class_), Post.user),
-            }
-        )
+        aliases = {
+            'user': (aliased(Post.user.property.mapper.class_), Post.user),
+        }
         sort_attrs = ['-created_at', 'user___name', '-user___age']
         query = SmartQueryMixin._sort_query(
-            query=Post.query,
+            query=POST_QUERY,
             sort_attrs=sort_attrs,
             root_cls=Post,
             aliases=aliases,
@@ -517,7 +460,7 @@ class TestSmartQueryMixin(unittest.IsolatedAsyncioTestCase):
         )
         with self.assertRaises(NoSortableError):
             SmartQueryMixin._sort_query(
-                query=Post.query,
+                query=POST_QUERY,
                 sort_attrs=['-created_at', 'user___fullname'],
                 root_cls=Post,
                 aliases=aliases,
@@ -526,14 +469,12 @@ class TestSmartQueryMixin(unittest.IsolatedAsyncioTestCase):
     def test_group_query(self):
         """Test for ``_group_query`` function."""
         logger.info('Testing "_group_query" function...')
-        aliases = OrderedDict(
-            {
-                'user': (aliased(Post.user.property.mapper.class_), Post.user),
-            }
-        )
+        aliases = {
+            'user': (aliased(Post.user.property.mapper.class_), Post.user),
+        }
         group_attrs = ['rating', 'user___name']
         query = SmartQueryMixin._group_query(
-            query=Post.query,
+            query=POST_QUERY,
             group_attrs=group_attrs,
             root_cls=Post,
             aliases=aliases,
@@ -541,7 +482,7 @@ class TestSmartQueryMixin(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(str(query).endswith('GROUP BY posts.rating, users_1.name'))
         with self.assertRaises(NoColumnOrHybridPropertyError):
             SmartQueryMixin._group_query(
-                query=Post.query,
+                query=POST_QUERY,
                 group_attrs=['rating', 'user___fullname'],
                 root_cls=Post,
                 aliases=aliases,